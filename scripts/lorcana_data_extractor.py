@@ -1,5 +1,6 @@
 import os
 import json
+import hashlib
 from datetime import datetime
 from inkcollector.cli import InkcollectorCLI
 from inkcollector.lorcast import LorcastAPI
@@ -22,6 +23,9 @@ class LorcanaExtractor:
         self.sets_dir = os.path.join(output_dir)
         self.cards_dir = os.path.join(output_dir, "sets")
         
+        # Per-file hash, size and card count, written to manifest.json for the processor
+        self.manifest = {}
+        
         # Create directories
         self._setup_directories()
         
@@ -60,12 +64,66 @@ class LorcanaExtractor:
             
             # Extract cards for this set
             self._extract_set_cards(set_id)
+        
+        self._save_manifest()
+    
+    def _write_json_array(self, items, file_path):
+        """
+        Encode a list to a pretty-printed JSON file one item at a time,
+        hashing and counting bytes in the same pass.
+        
+        The output is byte-for-byte what json.dump(items, f, indent=2) writes.
+        """
+        sha256 = hashlib.sha256()
+        size = 0
+        count = 0
+        temp_path = f"{file_path}.tmp"
+        
+        try:
+            with open(temp_path, "wb") as f:
+                def write(text):
+                    nonlocal size
+                    data = text.encode("utf-8")
+                    sha256.update(data)
+                    size += len(data)
+                    f.write(data)
+                
+                # Works for any iterable, so items can be consumed as they arrive
+                for item in items:
+                    write(",\n" if count else "[\n")
+                    item_json = json.dumps(item, ensure_ascii=False, indent=2)
+                    write("  " + item_json.replace("\n", "\n  "))
+                    count += 1
+                write("\n]" if count else "[]")
+            
+            os.replace(temp_path, file_path)
+        finally:
+            # Never leave a partial temp file behind for the workflow to commit
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+        
+        return {"sha256": sha256.hexdigest(), "size": size, "count": count}
+    
+    def _save_manifest(self):
+        """Save the manifest of every file written for this date."""
+        manifest_file = os.path.join(self.output_dir, "manifest.json")
+        manifest = {
+            "generated_at": datetime.now().isoformat(),
+            "files": self.manifest
+        }
+        with open(manifest_file, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
+        print(f"Saved manifest for {len(self.manifest)} files to {manifest_file}")
     
     def _save_all_sets(self, sets):
         """Save all sets data to JSON file."""
         sets_file = os.path.join(self.sets_dir, "sets.json")
-        with open(sets_file, "w", encoding="utf-8") as f:
-            json.dump(sets, f, ensure_ascii=False, indent=2)
+        info = self._write_json_array(sets, sets_file)
+        self.manifest["sets.json"] = {
+            "sha256": info["sha256"],
+            "size": info["size"],
+            "set_count": info["count"]
+        }
         print(f"Saved all sets data to {sets_file}")
     
     def _extract_set_cards(self, set_id):
@@ -81,8 +139,13 @@ class LorcanaExtractor:
         file_path = os.path.join(self.cards_dir, f"{set_id}.json")
         
         try:
-            with open(file_path, "w", encoding="utf-8") as f:
-                json.dump(cards, f, ensure_ascii=False, indent=2)
+            info = self._write_json_array(cards, file_path)
+            self.manifest[f"sets/{set_id}.json"] = {
+                "sha256": info["sha256"],
+                "size": info["size"],
+                "card_count": info["count"],
+                "set_id": set_id
+            }
             print(f"Cards data saved to {file_path}")
         except Exception as e:
             print(f"Error saving cards data to {file_path}: {e}")
@@ -1,14 +1,223 @@
 import os
+import sys
 import json
 import glob
+import shutil
+import hashlib
 import argparse
-from datetime import datetime
+import mmap
+import time
+import heapq
+import itertools
+import tracemalloc
+import subprocess
+from datetime import datetime, timedelta
 from pathlib import Path
 
+# Optional dependencies for columnar export (Parquet preferred, NumPy .npz fallback)
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Bump when the checkpoint layout changes so stale checkpoints are not resumed
+CHECKPOINT_VERSION = 2
+
+# Processing history entry holding the git commit the raw data was last processed at
+LAST_COMMIT_KEY = '_last_processed_commit'
+
+# Price changes older than this many days are folded into monthly summaries (0 keeps everything)
+PRICE_RETENTION_DAYS = 180
+
+# Number of most-changed cards and largest price moves kept in the change rollups
+ROLLUP_TOP_N = 100
+
+# Bump when the columnar export layout changes so existing exports are rewritten
+COLUMNAR_EXPORT_VERSION = 2
+
+# Ink colors are a closed set in the game, so they map to fixed boolean columns
+INK_COLORS = ['Amber', 'Amethyst', 'Emerald', 'Ruby', 'Sapphire', 'Steel']
+
+# Base schema for flattened card rows: (column name, column kind).
+# The set ID is the partition key, so it isn't repeated as a column.
+CARD_COLUMNS = [
+    ('id', 'str'), ('name', 'str'), ('version', 'str'), ('layout', 'str'),
+    ('released_at', 'str'), ('cost', 'int'), ('inkwell', 'bool'), ('ink', 'str'),
+    ('type', 'list'), ('classifications', 'list'), ('text', 'str'),
+    ('keywords', 'list'), ('move_cost', 'int'), ('strength', 'int'),
+    ('willpower', 'int'), ('lore', 'int'), ('rarity', 'str'),
+    ('illustrators', 'list'), ('collector_number', 'str'), ('lang', 'str'),
+    ('flavor_text', 'str'), ('tcgplayer_id', 'int'),
+    ('set_code', 'str'), ('set_name', 'str'),
+    ('price_usd', 'float'), ('price_usd_foil', 'float'),
+] + [(f"ink_{ink.lower()}", 'bool') for ink in INK_COLORS]
+
+# Card fields kept as packed attributes on CompactCard: everything the merge reads.
+# All other fields are rarely used during processing and are kept as they were loaded.
+COMPACT_HOT_FIELDS = (
+    'id', 'name', 'version', 'cost', 'strength', 'willpower', 'lore', 'text',
+    'flavor_text', 'rarity', 'released_at', 'legalities', 'prices',
+    'collector_number', 'keywords', 'classifications', 'ink', 'inks', 'type', 'set'
+)
+COMPACT_HOT_FIELD_SET = frozenset(COMPACT_HOT_FIELDS)
+
+# Fields whose strings repeat across cards and are interned
+COMPACT_INTERNED_FIELDS = {'name', 'version', 'rarity', 'released_at', 'collector_number', 'ink'}
+
+# Fields whose list/dict values repeat across cards and share one frozen instance
+COMPACT_SHARED_FIELDS = {'legalities', 'keywords', 'classifications', 'inks', 'type', 'set'}
+
+# Fields that differ per card and change between snapshots; they stay plain so they compare at dict speed
+COMPACT_PLAIN_FIELDS = {'prices'}
+
+
+class FrozenDict(tuple):
+    """Immutable (key, value) pairs standing in for a dict inside CompactCard"""
+    __slots__ = ()
+
+
+class CompactCard:
+    """Memory-compact card record used for the merge working set
+    
+    Hot fields are stored in slots with interned strings and shared frozen
+    containers; other fields are kept in a plain dict and never re-encoded.
+    Only cards that stay in the merge working set are converted. to_dict()
+    rebuilds the original card with the original key order.
+    """
+    __slots__ = COMPACT_HOT_FIELDS + ('_keys', '_extra')
+    
+    # Shared instances of key orders and frozen field values
+    _shared = {}
+    
+    @classmethod
+    def from_dict(cls, card, skip_keys=()):
+        """Build a compact card from a card dict, leaving out skip_keys"""
+        compact = cls.__new__(cls)
+        keys = []
+        extra = {}
+        for key, value in card.items():
+            if key in skip_keys:
+                continue
+            keys.append(key)
+            if key not in COMPACT_HOT_FIELD_SET:
+                extra[key] = value
+            elif key in COMPACT_PLAIN_FIELDS or (isinstance(value, str) and key not in COMPACT_INTERNED_FIELDS):
+                setattr(compact, key, value)
+            else:
+                setattr(compact, key, cls._pack(key, value))
+        
+        # Key orders repeat across cards, so the tuple (and its strings) is shared
+        keys = tuple(keys)
+        if keys not in cls._shared:
+            cls._shared[keys] = tuple(sys.intern(key) for key in keys)
+        compact._keys = cls._shared[keys]
+        compact._extra = extra or None
+        return compact
+    
+    @classmethod
+    def _pack(cls, key, value):
+        """Convert a field value to its compact form"""
+        if isinstance(value, str):
+            return sys.intern(value) if key in COMPACT_INTERNED_FIELDS else value
+        if isinstance(value, list):
+            try:
+                # Fast path for the common list of strings
+                packed = tuple(map(sys.intern, value))
+            except TypeError:
+                packed = tuple(cls._pack_item(item) for item in value)
+        elif isinstance(value, dict):
+            packed = FrozenDict(value.items())
+            try:
+                hash(packed)
+            except TypeError:
+                # Nested lists or dicts need packing too
+                packed = cls._pack_item(value)
+        else:
+            return value
+        
+        if key in COMPACT_SHARED_FIELDS:
+            return cls._shared.setdefault((key, packed), packed)
+        return packed
+    
+    @classmethod
+    def _pack_item(cls, value):
+        """Convert a value nested inside a list or dict to its compact form"""
+        if isinstance(value, str):
+            return sys.intern(value)
+        if isinstance(value, list):
+            return tuple(cls._pack_item(item) for item in value)
+        if isinstance(value, dict):
+            return FrozenDict((sys.intern(k), cls._pack_item(v)) for k, v in value.items())
+        return value
+    
+    @classmethod
+    def _unpack(cls, value):
+        """Convert a compact value back to plain JSON types"""
+        if isinstance(value, FrozenDict):
+            return {k: cls._unpack(v) for k, v in value}
+        if isinstance(value, tuple):
+            return [cls._unpack(item) for item in value]
+        return value
+    
+    def __getitem__(self, key):
+        if key in COMPACT_HOT_FIELD_SET:
+            try:
+                return self._unpack(getattr(self, key))
+            except AttributeError:
+                # Unset slots are fields the card doesn't have
+                raise KeyError(key) from None
+        if self._extra is None:
+            raise KeyError(key)
+        return self._extra[key]
+    
+    def __contains__(self, key):
+        return key in self._keys
+    
+    def get(self, key, default=None):
+        """Return a field as a plain JSON value, like dict.get"""
+        try:
+            return self[key]
+        except KeyError:
+            return default
+    
+    def matches(self, key, value):
+        """Check a hot field against a plain JSON value without unpacking it
+        
+        A False result may be a false negative for nested values, so callers
+        confirm a mismatch with get().
+        """
+        # Unset slots are missing fields, which get() reports as None
+        packed = getattr(self, key, None)
+        if packed == value:
+            return True
+        if isinstance(value, dict):
+            # FrozenDict is a tuple, so flat dicts compare pair by pair
+            return tuple(value.items()) == packed
+        if isinstance(value, list):
+            return tuple(value) == packed
+        return False
+    
+    def to_dict(self):
+        """Rebuild the original card dict"""
+        extra = self._extra or {}
+        return {
+            key: self._unpack(getattr(self, key)) if key in COMPACT_HOT_FIELD_SET else extra[key]
+            for key in self._keys
+        }
+
+
 class LorcanaDataProcessor:
     """Main processor for consolidating Lorcana data with timestamps"""
     
-    def __init__(self, input_dir='data/raw/lorcast', output_dir='data/processed/lorcast'):
+    def __init__(self, input_dir='data/raw/lorcast', output_dir='data/processed/lorcast', checkpoint_interval=0.0,
+                 retention_days=PRICE_RETENTION_DAYS):
         self.input_dir = Path(input_dir)
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
@@ -21,6 +230,31 @@ class LorcanaDataProcessor:
         self.changes_file = self.output_dir / 'card_changes.json'
         self.card_changes = self.load_card_changes()
         
+        # Rollups of card changes, kept up to date as changes are tracked
+        self.rollups_file = self.output_dir / 'change_rollups.json'
+        self.price_move_counter = itertools.count()
+        # Moves in the price-move heap by (card_id, price, old, new), so a repeated move is kept once
+        self.price_move_index = {}
+        self.change_rollups = self.load_change_rollups()
+        
+        # Checkpoint written after each merged snapshot so interrupted runs can resume
+        self.checkpoint_file = self.output_dir / 'processing_checkpoint.json'
+        # Change entries tracked since card_changes.json was loaded, appended at each checkpoint
+        self.changes_journal_file = self.output_dir / 'processing_checkpoint.changes.ndjson'
+        # Encoded card data of each set as of the last checkpoint: set ID -> (card list, JSON)
+        self.checkpoint_cards_cache = {}
+        # Minimum seconds between checkpoints; 0 writes one after every merged snapshot date
+        self.checkpoint_interval = checkpoint_interval
+        
+        # Retention window for verbatim price changes
+        self.retention_days = retention_days
+        
+        # Extractor manifests (file -> hash, size, card count, set ID), loaded per snapshot date
+        self.manifests = {}
+        
+        # Raw files selected from git (date -> file keys), or None to scan the whole input tree
+        self.git_selection = None
+        
         # Mapping for friendly names to set IDs
         self.friendly_to_set_id = {
             'the_first_chapter': 'set_7ecb0e0c71af496a9e01110e23824e0a5',
@@ -70,6 +304,156 @@ class LorcanaDataProcessor:
         with open(self.changes_file, 'w', encoding='utf-8') as f:
             json.dump(self.card_changes, f, indent=2, ensure_ascii=False)
     
+    def load_change_rollups(self):
+        """Load change rollups, rebuilding them if they don't match the card changes"""
+        rollups = None
+        if self.rollups_file.exists():
+            try:
+                with open(self.rollups_file, 'r', encoding='utf-8') as f:
+                    rollups = json.load(f)
+            except (json.JSONDecodeError, FileNotFoundError):
+                rollups = None
+        
+        total_changes = sum(self.get_change_weight(change) for data in self.card_changes.values()
+                            for change in data.get('changes', []))
+        if not rollups or rollups.get('total_changes') != total_changes:
+            return self.rebuild_change_rollups()
+        
+        # Price moves are kept as a min-heap on |delta| so the smallest is cheap to evict
+        # (negative sequence numbers never collide with the ones given to new moves, and
+        # increase in saved order so ties keep their order across reloads)
+        moves = rollups['price_moves']
+        rollups['price_moves'] = []
+        self.price_move_index = {}
+        for i, move in enumerate(moves):
+            self.add_price_move(rollups, move, i - len(moves))
+        if len(rollups['price_moves']) < len(moves):
+            # Rollups saved before moves were deduplicated; rebuild so the top-N is full
+            return self.rebuild_change_rollups()
+        return rollups
+    
+    def rebuild_change_rollups(self):
+        """Recompute change rollups from the full card changes history"""
+        self.price_move_index = {}
+        self.change_rollups = {
+            'total_changes': 0,
+            'by_field': {},
+            'by_date': {},
+            'card_counts': {},
+            'price_moves': []
+        }
+        for card_id, data in self.card_changes.items():
+            for change in data.get('changes', []):
+                self.update_change_rollups(card_id, change)
+        return self.change_rollups
+    
+    def get_change_weight(self, change_entry):
+        """Number of changes an entry stands for; a monthly price summary counts the changes folded into it"""
+        if change_entry.get('field') == 'prices_summary':
+            return change_entry.get('count', 1)
+        return 1
+    
+    def update_change_rollups(self, card_id, change_entry):
+        """Add one change entry to the rollup tables"""
+        rollups = self.change_rollups
+        field = change_entry.get('field', 'unknown')
+        date = change_entry.get('date', 'unknown')
+        weight = self.get_change_weight(change_entry)
+        
+        summary = field == 'prices_summary'
+        if summary:
+            # Folded price changes stay price changes, bucketed by the month they were folded into
+            field = 'prices'
+            date = change_entry.get('period', date)
+        
+        rollups['total_changes'] += weight
+        rollups['by_field'][field] = rollups['by_field'].get(field, 0) + weight
+        date_rollup = rollups['by_date'].setdefault(date, {'total': 0, 'fields': {}})
+        date_rollup['total'] += weight
+        date_rollup['fields'][field] = date_rollup['fields'].get(field, 0) + weight
+        rollups['card_counts'][card_id] = rollups['card_counts'].get(card_id, 0) + weight
+        
+        if field != 'prices':
+            return
+        
+        old_prices = change_entry.get('old_value') or {}
+        new_prices = change_entry.get('new_value') or {}
+        if not isinstance(old_prices, dict) or not isinstance(new_prices, dict):
+            return
+        
+        for price_key in sorted(set(old_prices) | set(new_prices)):
+            old_price = self.parse_price(old_prices.get(price_key))
+            new_price = self.parse_price(new_prices.get(price_key))
+            if old_price is None or new_price is None:
+                continue
+            
+            if summary:
+                # The month's price range, in the direction of its net move
+                low = change_entry.get('min', {}).get(price_key, min(old_price, new_price))
+                high = change_entry.get('max', {}).get(price_key, max(old_price, new_price))
+                old_price, new_price = (high, low) if new_price < old_price else (low, high)
+            if old_price == new_price:
+                continue
+            
+            move = {
+                'card_id': card_id,
+                'date': change_entry.get('last_date', date) if summary else date,
+                'price': price_key,
+                'old': old_price,
+                'new': new_price,
+                'delta': round(new_price - old_price, 2)
+            }
+            if summary:
+                move['period'] = change_entry.get('period')
+            self.add_price_move(rollups, move, next(self.price_move_counter))
+    
+    def add_price_move(self, rollups, move, sequence):
+        """Offer a price move to the top-N heap; a move already in it only takes the later date"""
+        key = (move['card_id'], move['price'], move['old'], move['new'])
+        existing = self.price_move_index.get(key)
+        if existing is not None:
+            # Same |delta|, so updating in place keeps the heap valid
+            existing['date'] = max(existing['date'], move['date'])
+            return
+        
+        heap_entry = (abs(move['delta']), sequence, move)
+        if len(rollups['price_moves']) < ROLLUP_TOP_N:
+            heapq.heappush(rollups['price_moves'], heap_entry)
+        elif heap_entry[0] > rollups['price_moves'][0][0]:
+            evicted = heapq.heapreplace(rollups['price_moves'], heap_entry)[2]
+            del self.price_move_index[(evicted['card_id'], evicted['price'], evicted['old'], evicted['new'])]
+        else:
+            return
+        self.price_move_index[key] = move
+    
+    def save_change_rollups(self):
+        """Save change rollups with the top-N tables materialized for the inspector"""
+        rollups = self.change_rollups
+        top_cards = heapq.nlargest(ROLLUP_TOP_N, rollups['card_counts'].items(), key=lambda x: x[1])
+        price_moves = [move for _, _, move in sorted(rollups['price_moves'], key=lambda x: (-x[0], x[1]))]
+        
+        output = {
+            'total_changes': rollups['total_changes'],
+            'total_cards': len(rollups['card_counts']),
+            'by_field': rollups['by_field'],
+            'by_date': dict(sorted(rollups['by_date'].items())),
+            'top_cards': [
+                {
+                    'card_id': card_id,
+                    'card_name': self.card_changes.get(card_id, {}).get('card_name', ''),
+                    'changes': count
+                }
+                for card_id, count in top_cards
+            ],
+            'price_moves': [
+                {**move, 'card_name': self.card_changes.get(move['card_id'], {}).get('card_name', '')}
+                for move in price_moves
+            ],
+            'card_counts': rollups['card_counts']
+        }
+        with open(self.rollups_file, 'w', encoding='utf-8') as f:
+            json.dump(output, f, indent=2, ensure_ascii=False)
+    
     def track_card_change(self, card_id, field, old_value, new_value, date_found):
         """Track a change to a specific card field"""
         if card_id not in self.card_changes:
@@ -87,6 +471,158 @@ class LorcanaDataProcessor:
         }
         
         self.card_changes[card_id]['changes'].append(change_entry)
+        self.update_change_rollups(card_id, change_entry)
+    
+    def compact_card_changes(self):
+        """Fold price changes older than the retention window into monthly summaries
+        and drop no-op price flip-flops; all other fields are kept verbatim"""
+        stats = {'dropped': 0, 'folded': 0, 'summaries': 0}
+        if not self.retention_days:
+            return stats
+        
+        # The window is measured back from the newest change so results don't depend on when we run
+        latest_date = max((change.get('date', '') for data in self.card_changes.values()
+                           for change in data.get('changes', [])), default='')
+        try:
+            cutoff = datetime.strptime(latest_date, '%Y-%m-%d') - timedelta(days=self.retention_days)
+        except ValueError:
+            return stats
+        # Only whole months are folded, so a month is never split across two passes
+        cutoff_period = cutoff.strftime('%Y-%m')
+        
+        for data in self.card_changes.values():
+            changes, dropped = self.drop_price_flip_flops(data.get('changes', []))
+            stats['dropped'] += dropped
+            
+            compacted = []
+            summaries = {}
+            for change in changes:
+                field = change.get('field')
+                period = change.get('period') if field == 'prices_summary' else str(change.get('date', ''))[:7]
+                foldable = (
+                    field in ('prices', 'prices_summary')
+                    and len(period) == 7 and period < cutoff_period
+                    and isinstance(change.get('old_value'), dict)
+                    and isinstance(change.get('new_value'), dict)
+                )
+                if not foldable:
+                    compacted.append(change)
+                    continue
+                
+                summary = change if field == 'prices_summary' else self.new_price_summary(change)
+                if field == 'prices':
+                    stats['folded'] += 1
+                
+                if period in summaries:
+                    self.merge_price_summaries(summaries[period], summary)
+                else:
+                    summaries[period] = summary
+                    compacted.append(summary)
+                    if field == 'prices':
+                        stats['summaries'] += 1
+            
+            data['changes'] = compacted
+        
+        if stats['dropped'] or stats['folded']:
+            self.rebuild_change_rollups()
+        return stats
+    
+    def drop_price_flip_flops(self, changes):
+        """Drop price changes that change nothing or are reverted on the same date"""
+        kept = []
+        price_positions = []
+        dropped = 0
+        
+        for change in changes:
+            if change.get('field') == 'prices':
+                if change.get('old_value') == change.get('new_value'):
+                    dropped += 1
+                    continue
+                
+                previous = kept[price_positions[-1]] if price_positions else None
+                if (previous is not None
+                        and previous.get('date') == change.get('date')
+                        and previous.get('old_value') == change.get('new_value')
+                        and previous.get('new_value') == change.get('old_value')):
+                    # Only non-price entries follow the previous price entry, so nothing else shifts
+                    del kept[price_positions.pop()]
+                    dropped += 2
+                    continue
+                
+                price_positions.append(len(kept))
+            kept.append(change)
+        
+        return kept, dropped
+    
+    def new_price_summary(self, change):
+        """Build a one-change monthly price summary record"""
+        old_prices = change.get('old_value') or {}
+        new_prices = change.get('new_value') or {}
+        summary = {
+            'date': change.get('date'),
+            'field': 'prices_summary',
+            'period': str(change.get('date', ''))[:7],
+            'first_date': change.get('date'),
+            'last_date': change.get('date'),
+            'count': 1,
+            'old_value': dict(old_prices),
+            'new_value': dict(new_prices),
+            'min': {},
+            'max': {},
+            'timestamp': datetime.now().isoformat()
+        }
+        for prices in (old_prices, new_prices):
+            for price_key, value in prices.items():
+                price = self.parse_price(value)
+                if price is None:
+                    continue
+                summary['min'][price_key] = min(price, summary['min'].get(price_key, price))
+                summary['max'][price_key] = max(price, summary['max'].get(price_key, price))
+        return summary
+    
+    def merge_price_summaries(self, target, other):
+        """Merge one monthly price summary into another for the same period"""
+        target['count'] += other['count']
+        if other['first_date'] < target['first_date']:
+            target['first_date'] = other['first_date']
+            target['old_value'] = other['old_value']
+        if other['last_date'] >= target['last_date']:
+            target['last_date'] = other['last_date']
+            target['new_value'] = other['new_value']
+            target['date'] = other['last_date']
+        for price_key, price in other['min'].items():
+            target['min'][price_key] = min(price, target['min'].get(price_key, price))
+        for price_key, price in other['max'].items():
+            target['max'][price_key] = max(price, target['max'].get(price_key, price))
+    
+    def compact_changes_file(self):
+        """Compact card_changes.json on disk and report what it saved"""
+        print(f"🗜️ Compacting card changes (price retention: {self.retention_days} days)...")
+        if not self.changes_file.exists():
+            print("❌ No card changes data found. Process data first to track changes.")
+            return
+        
+        size_before, load_before = self.measure_changes_file()
+        stats = self.compact_card_changes()
+        if not stats['dropped'] and not stats['folded']:
+            print("  Nothing to compact")
+            return
+        
+        self.save_card_changes()
+        self.save_change_rollups()
+        size_after, load_after = self.measure_changes_file()
+        
+        print(f"  Dropped {stats['dropped']} no-op price changes")
+        print(f"  Folded {stats['folded']} price changes into {stats['summaries']} monthly summaries")
+        print(f"  File size: {size_before:,} -> {size_after:,} bytes (saved {size_before - size_after:,})")
+        print(f"  Load time: {load_before:.3f}s -> {load_after:.3f}s (saved {load_before - load_after:.3f}s)")
+    
+    def measure_changes_file(self):
+        """Get the size of card_changes.json and the time it takes to load"""
+        start = time.perf_counter()
+        with open(self.changes_file, 'r', encoding='utf-8') as f:
+            json.load(f)
+        return self.changes_file.stat().st_size, time.perf_counter() - start
     
     def compare_cards(self, old_card, new_card, date_found):
         """Compare two versions of a card and track changes"""
@@ -107,8 +643,12 @@ class LorcanaDataProcessor:
         ]
         
         for field in monitored_fields:
-            old_value = old_card.get(field)
+            # The existing card is compact and the new one a raw dict; most fields match as-is
             new_value = new_card.get(field)
+            if old_card.matches(field, new_value):
+                continue
+            
+            old_value = old_card.get(field)
             
             # Compare values, handling None and different types
             if old_value != new_value:
@@ -134,10 +674,39 @@ class LorcanaDataProcessor:
         except OSError:
             return None
     
+    def load_manifest(self, date_dir):
+        """Load the extractor's manifest.json for a snapshot date, if it has one"""
+        if date_dir.name not in self.manifests:
+            manifest_file = date_dir / 'manifest.json'
+            files = {}
+            if manifest_file.exists():
+                try:
+                    with open(manifest_file, 'r', encoding='utf-8') as f:
+                        files = json.load(f).get('files', {})
+                except (json.JSONDecodeError, FileNotFoundError, AttributeError):
+                    files = {}
+            self.manifests[date_dir.name] = files
+        return self.manifests[date_dir.name]
+    
+    def get_manifest_entry(self, file_path):
+        """Get the manifest entry for a raw file, or None if its snapshot has no manifest"""
+        relative_path = file_path.relative_to(self.input_dir)
+        date_dir = self.input_dir / relative_path.parts[0]
+        file_key = Path(*relative_path.parts[1:]).as_posix()
+        return self.load_manifest(date_dir).get(file_key)
+    
+    def get_file_signature(self, file_path):
+        """Get a raw file's content hash, trusting the extractor's manifest when available"""
+        # Content hashes survive fresh checkouts, unlike size + mtime
+        entry = self.get_manifest_entry(file_path)
+        if entry and entry.get('sha256'):
+            return f"sha256:{entry['sha256']}"
+        return self.get_content_hash(file_path)
+    
     def should_process_file(self, file_path, date_str):
         """Check if a file needs processing based on change detection"""
         file_key = str(file_path.relative_to(self.input_dir))
-        current_hash = self.get_file_hash(file_path)
+        current_hash = self.get_file_signature(file_path)
         
         if current_hash is None:
             return False
@@ -149,112 +718,449 @@ class LorcanaDataProcessor:
             if stored_info.get('hash') == current_hash:
                 return False
         
-        # File is new or changed, mark it for processing
+        return True
+    
+    def mark_file_processed(self, file_path, date_str):
+        """Record a file in the processing history once it has been merged"""
+        file_key = str(file_path.relative_to(self.input_dir))
         self.processed_files[file_key] = {
-            'hash': current_hash,
+            'hash': self.get_file_signature(file_path),
             'last_processed': date_str,
             'processing_date': datetime.now().isoformat()
         }
         
-        return True
-        
     def force_reprocess(self):
         """Clear processing history to force reprocessing of all files"""
+        # The history file is left on disk and overwritten at the end of the run,
+        # so an interrupted forced run can still be resumed from its checkpoint
         self.processed_files = {}
-        if self.tracking_file.exists():
-            self.tracking_file.unlink()
         # Note: We keep card_changes history as it's valuable historical data
         print("🔄 Processing history cleared - all files will be reprocessed")
+    
+    def get_content_hash(self, file_path):
+        """Get the SHA-256 of a file's content, or None if it can't be read"""
+        sha256 = hashlib.sha256()
+        try:
+            with open(file_path, 'rb') as f:
+                for block in iter(lambda: f.read(1 << 20), b''):
+                    sha256.update(block)
+        except OSError:
+            return None
+        return f"sha256:{sha256.hexdigest()}"
+    
+    def get_output_signatures(self):
+        """Get content hashes of the saved outputs a run starts from"""
+        # Size + mtime would differ on every fresh checkout, so a CI job could never resume another's checkpoint
+        output_files = [self.output_dir / 'sets.json', self.tracking_file, self.changes_file]
+        return {output_file.name: self.get_content_hash(output_file) for output_file in output_files}
+    
+    def load_checkpoint(self):
+        """Load the checkpoint left by an interrupted run, if any"""
+        if not self.checkpoint_file.exists():
+            return None
+        
+        try:
+            with open(self.checkpoint_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (json.JSONDecodeError, FileNotFoundError):
+            return None
+    
+    def save_checkpoint(self, state, sets_data, cards_data):
+        """Atomically save merge state, processing history and card changes"""
+        checkpoint = {
+            **state,
+            'sets_data': sets_data,
+            'processed_files': self.processed_files
+        }
+        if state['phase'] == 'saving':
+            # card_changes.json is about to be rewritten, so it can't serve as the base
+            checkpoint['card_changes'] = self.card_changes
+        else:
+            # Only the journal's prefix written so far belongs to this checkpoint
+            checkpoint['changes_journal_size'] = self.append_changes_journal()
+        
+        # A set's card list is replaced whenever its cards change, so an unchanged list
+        # reuses the JSON encoded for the previous checkpoint
+        encoded_sets = []
+        for set_id, data in cards_data.items():
+            cached = self.checkpoint_cards_cache.get(set_id)
+            if cached is None or cached[0] is not data['cards']:
+                # json.dumps uses the C encoder, json.dump to a file does not
+                cached = (data['cards'], json.dumps(data, ensure_ascii=False, separators=(',', ':'),
+                                                    default=CompactCard.to_dict))
+                self.checkpoint_cards_cache[set_id] = cached
+            encoded_sets.append(f"{json.dumps(set_id)}:{cached[1]}")
+        
+        temp_file = self.checkpoint_file.with_name(self.checkpoint_file.name + '.tmp')
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            f.write(f'{{"cards_data":{{{",".join(encoded_sets)}}},')
+            f.write(json.dumps(checkpoint, ensure_ascii=False, separators=(',', ':'))[1:])
+        os.replace(temp_file, self.checkpoint_file)
+    
+    def append_changes_journal(self):
+        """Append the change entries tracked since the last checkpoint to the journal and return its size
+        
+        Each checkpoint writes only its own entries, so checkpointing every snapshot
+        stays linear in the number of changes rather than rewriting all of them.
+        """
+        # One line per checkpoint: [[card_id, card_name, new change entries], ...]. Card names are
+        # refreshed on every merge, so a renamed card is journaled even without new entries.
+        appended = []
+        for card_id, data in self.card_changes.items():
+            journaled = self.journaled_state.get(card_id)
+            if journaled != (len(data['changes']), data['card_name']):
+                start = journaled[0] if journaled else 0
+                appended.append([card_id, data['card_name'], data['changes'][start:]])
+                self.journaled_state[card_id] = (len(data['changes']), data['card_name'])
+        
+        with open(self.changes_journal_file, 'r+b' if self.changes_journal_size else 'wb') as f:
+            # Drop anything an interrupted checkpoint appended after the last complete one
+            f.seek(self.changes_journal_size)
+            f.truncate()
+            if appended:
+                f.write((json.dumps(appended, ensure_ascii=False, separators=(',', ':')) + '\n').encode('utf-8'))
+            self.changes_journal_size = f.tell()
+        return self.changes_journal_size
+    
+    def get_card_changes_state(self):
+        """Get the number of change entries and the name recorded for each card"""
+        return {card_id: (len(data['changes']), data['card_name']) for card_id, data in self.card_changes.items()}
+    
+    def load_changes_journal(self, size):
+        """Append the change entries journaled up to a checkpoint to the loaded card changes"""
+        with open(self.changes_journal_file, 'rb') as f:
+            lines = f.read(size).decode('utf-8').splitlines()
+        for line in lines:
+            for card_id, card_name, changes in json.loads(line):
+                if card_id not in self.card_changes:
+                    self.card_changes[card_id] = {'card_name': '', 'changes': []}
+                self.card_changes[card_id]['card_name'] = card_name
+                self.card_changes[card_id]['changes'].extend(changes)
+                for change in changes:
+                    self.update_change_rollups(card_id, change)
+        self.journaled_state = self.get_card_changes_state()
+        self.changes_journal_size = size
+    
+    def clear_checkpoint(self):
+        """Remove the checkpoint once a run has saved all of its outputs"""
+        for checkpoint_file in [self.checkpoint_file, self.changes_journal_file]:
+            if checkpoint_file.exists():
+                checkpoint_file.unlink()
+    
+    def is_checkpoint_saved(self, checkpoint):
+        """Check whether a run interrupted while saving had already written its processing history"""
+        if checkpoint.get('version') != CHECKPOINT_VERSION or 'base_outputs' not in checkpoint:
+            return False
+        # processing_history.json is saved last, so once it moved on from the run's starting point
+        # every output of that run (or of a later one) is on disk
+        return checkpoint['base_outputs'].get(self.tracking_file.name) != self.get_content_hash(self.tracking_file)
+    
+    def validate_checkpoint(self, checkpoint):
+        """Check that a checkpoint still matches the inputs and outputs it was built from"""
+        problems = []
+        
+        if checkpoint.get('version') != CHECKPOINT_VERSION:
+            return [f"unsupported checkpoint version {checkpoint.get('version')}"]
+        
+        required_keys = ['sets_data', 'cards_data', 'processed_files', 'base_outputs']
+        missing_keys = [key for key in required_keys if key not in checkpoint]
+        if 'card_changes' not in checkpoint and 'changes_journal_size' not in checkpoint:
+            missing_keys.append('card_changes')
+        if missing_keys:
+            return [f"checkpoint is missing {', '.join(missing_keys)}"]
+        
+        if 'card_changes' not in checkpoint:
+            journal_size = self.changes_journal_file.stat().st_size if self.changes_journal_file.exists() else 0
+            if journal_size < checkpoint['changes_journal_size']:
+                problems.append(f"{self.changes_journal_file.name} is shorter than the checkpoint expects")
+        
+        if checkpoint.get('input_dir') != str(self.input_dir.resolve()):
+            problems.append(f"checkpoint was made for input directory {checkpoint.get('input_dir')}")
+        
+        # Outputs may only differ from the run's starting point once the run began saving them
+        if checkpoint.get('phase') != 'saving' and checkpoint['base_outputs'] != self.get_output_signatures():
+            problems.append("processed outputs changed since the checkpoint was written")
+        
+        # Every raw file of a completed date must be merged in its current form. A run that got to
+        # saving is finished as it was merged; files changed since then keep their old hash in its
+        # history and are merged again by the next run.
+        last_completed = checkpoint.get('last_completed_date')
+        if last_completed and checkpoint.get('phase') != 'saving':
+            if not (self.input_dir / last_completed).is_dir():
+                problems.append(f"snapshot {last_completed} no longer exists")
+            
+            for date_dir in self.get_date_dirs():
+                if date_dir.name > last_completed:
+                    break
+                raw_files = [date_dir / 'sets.json'] + sorted((date_dir / 'sets').glob('*.json'))
+                for raw_file in raw_files:
+                    if not raw_file.exists():
+                        continue
+                    file_key = str(raw_file.relative_to(self.input_dir))
+                    stored_info = checkpoint['processed_files'].get(file_key, {})
+                    if stored_info.get('hash') != self.get_file_signature(raw_file):
+                        problems.append(f"{file_key} is new or changed since it was checkpointed")
+        
+        return problems
+        
+    def run_git(self, *args):
+        """Run a git command inside the input directory and return its stdout"""
+        result = subprocess.run(['git', '-C', str(self.input_dir), *args],
+                                capture_output=True, text=True, check=True)
+        return result.stdout
+    
+    def get_git_head(self):
+        """Get the current commit of the repository holding the raw data, or None"""
+        if not self.input_dir.exists():
+            return None
+        try:
+            return self.run_git('rev-parse', 'HEAD').strip()
+        except (OSError, subprocess.CalledProcessError):
+            return None
+    
+    def select_files_from_git(self):
+        """Ask git which raw files were added or modified since the last processed commit"""
+        if self.get_git_head() is None:
+            print("ℹ️ Raw data is not in a git repository - scanning all raw files")
+            return None
         
-    def run(self):
-        """Main processing method - simple and clear"""
+        last_commit = self.processed_files.get(LAST_COMMIT_KEY, {}).get('commit')
+        if not last_commit:
+            print("ℹ️ No processed commit recorded yet - scanning all raw files")
+            return None
+        
+        try:
+            self.run_git('cat-file', '-e', f"{last_commit}^{{commit}}")
+            # Committed changes since the last run plus uncommitted edits to tracked files
+            changed = self.run_git('diff', '--name-only', '-z', '--relative', '--diff-filter=ACMR',
+                                   last_commit, '--', '.')
+            untracked = self.run_git('ls-files', '-z', '--others', '--exclude-standard', '--', '.')
+        except (OSError, subprocess.CalledProcessError):
+            print(f"ℹ️ Commit {last_commit[:12]} is not available in git - scanning all raw files")
+            return None
+        
+        selection = {}
+        for file_key in (changed + untracked).split('\0'):
+            parts = Path(file_key).parts
+            is_sets_file = len(parts) == 2 and parts[1] == 'sets.json'
+            is_card_file = len(parts) == 3 and parts[1] == 'sets' and parts[2].endswith('.json')
+            if is_sets_file or is_card_file:
+                selection.setdefault(parts[0], set()).add(Path(file_key).as_posix())
+        
+        file_count = sum(len(keys) for keys in selection.values())
+        print(f"🔍 Git: {file_count} raw files changed since {last_commit[:12]} in {len(selection)} snapshots")
+        return selection
+    
+    def record_processed_commit(self):
+        """Remember the commit the raw data was processed at for the next git-based run"""
+        head = self.get_git_head()
+        if head:
+            self.processed_files[LAST_COMMIT_KEY] = {
+                'commit': head,
+                'processing_date': datetime.now().isoformat()
+            }
+    
+    def run(self, resume=False, use_git=False):
+        """Main processing method - merges one snapshot date at a time with checkpoints"""
         print("🚀 Starting Lorcana data processing...")
         
-        # Step 1: Process sets metadata
-        sets_data = self.process_sets()
+        # Checkpoints journal only the change entries appended on top of card_changes.json
+        self.journaled_state = self.get_card_changes_state()
+        self.changes_journal_size = 0
+        
+        checkpoint = self.load_checkpoint()
+        # A run interrupted while saving may have written some outputs already, so it can't be ignored
+        saving = bool(checkpoint) and checkpoint.get('phase') == 'saving'
+        if checkpoint and not resume and not saving:
+            print("⚠️ Ignoring checkpoint from an interrupted run (use --resume to continue it)")
+            checkpoint = None
+        elif resume and not checkpoint:
+            print("ℹ️ No checkpoint found - starting a normal run")
+        
+        if checkpoint and saving and self.is_checkpoint_saved(checkpoint):
+            print("ℹ️ Removing checkpoint of an interrupted run that had already saved all of its outputs")
+            self.clear_checkpoint()
+            checkpoint = None
+        
+        if checkpoint:
+            problems = self.validate_checkpoint(checkpoint)
+            if problems:
+                print("⚠️ Checkpoint failed consistency checks:")
+                for problem in problems[:10]:
+                    print(f"   - {problem}")
+                if len(problems) > 10:
+                    print(f"   ... and {len(problems) - 10} more")
+                if saving:
+                    raise SystemExit(f"❌ The last run was interrupted while saving and its checkpoint can't be resumed. "
+                                     f"Outputs may be partly saved; fix the problems above or remove "
+                                     f"{self.checkpoint_file} to start over from them")
+                print("   Starting over from the last saved outputs")
+                checkpoint = None
+            elif saving and not resume:
+                print("⚠️ The last run was interrupted while saving - resuming it so its changes are not lost")
+        
+        if checkpoint:
+            print(f"⏩ Resuming after snapshot {checkpoint.get('last_completed_date') or '(none)'}")
+            sets_data = checkpoint.pop('sets_data')
+            cards_data = checkpoint.pop('cards_data')
+            for data in cards_data.values():
+                data['cards'] = [CompactCard.from_dict(card) for card in data['cards']]
+            self.processed_files = checkpoint.pop('processed_files')
+            if 'card_changes' in checkpoint:
+                self.card_changes = checkpoint.pop('card_changes')
+                self.rebuild_change_rollups()
+            else:
+                self.load_changes_journal(checkpoint.pop('changes_journal_size'))
+            state = checkpoint
+        else:
+            # A checkpoint that isn't resumed is replaced; its journal must not be mixed with this run's
+            self.clear_checkpoint()
+            state = {
+                'version': CHECKPOINT_VERSION,
+                'input_dir': str(self.input_dir.resolve()),
+                'started_at': datetime.now().isoformat(),
+                'base_outputs': self.get_output_signatures(),
+                'last_completed_date': None,
+                'phase': 'merging'
+            }
+            sets_data = self.load_existing_sets_data()
+            cards_data = self.load_existing_cards_data()
+        
+        if use_git:
+            self.git_selection = self.select_files_from_git()
         
-        # Step 2: Process card data
-        cards_data = self.process_cards()
+        # Step 1: Merge sets metadata and card data, one snapshot date at a time
+        sets_data, cards_data = self.process_snapshots(sets_data, cards_data, state)
         
-        # Step 3: Save all data
+        # Apply the price retention policy before anything is saved
+        compaction = self.compact_card_changes()
+        if compaction['dropped'] or compaction['folded']:
+            print(f"🗜️ Dropped {compaction['dropped']} no-op price changes, "
+                  f"folded {compaction['folded']} old price changes into monthly summaries")
+        
+        # Step 2: Save all data (a crash from here on resumes straight into saving)
+        state['phase'] = 'saving'
+        self.save_checkpoint(state, sets_data, cards_data)
         self.save_data(sets_data, cards_data)
         
-        # Step 4: Create summary report
+        # Step 3: Create summary report
         self.create_report(sets_data, cards_data)
         
-        # Step 5: Save processing history
-        self.save_processing_history()
-        
-        # Step 6: Save card changes tracking
+        # Step 4: Save card changes tracking and rollups
         self.save_card_changes()
+        self.save_change_rollups()
         
-        print("✅ Processing complete!")
+        # Step 5: Save processing history last; it marks the run's files as merged,
+        # so it must not be written before everything they produced
+        self.record_processed_commit()
+        self.save_processing_history()
         
-    def process_sets(self):
-        """Process all sets.json files and consolidate metadata"""
-        print("📚 Step 1: Processing sets metadata...")
+        self.clear_checkpoint()
+        print("✅ Processing complete!")
+    
+    def get_date_dirs(self):
+        """Get the snapshot date directories in chronological order"""
+        return sorted([d for d in self.input_dir.iterdir() if d.is_dir()])
+    
+    def process_snapshots(self, sets_data, cards_data, state):
+        """Merge every snapshot date in order, checkpointing after each one"""
+        print("📚 Step 1: Processing sets metadata and card data...")
         
         # Check if input directory exists
         if not self.input_dir.exists():
             print(f"⚠️ Input directory does not exist: {self.input_dir}")
             print("   Creating empty processed data structure...")
-            return {}
-        
-        # Load existing processed sets data
-        sets_data = self.load_existing_sets_data()
+            return {}, {}
         
         try:
-            date_dirs = sorted([d for d in self.input_dir.iterdir() if d.is_dir()])
+            if self.git_selection is not None:
+                # Only snapshots git reports changes for; no need to walk the whole archive
+                date_dirs = [self.input_dir / date for date in sorted(self.git_selection)
+                             if (self.input_dir / date).is_dir()]
+            else:
+                date_dirs = self.get_date_dirs()
         except (FileNotFoundError, OSError) as e:
             print(f"⚠️ Cannot access input directory: {e}")
             print("   Creating empty processed data structure...")
-            return {}
+            return {}, {}
+        
         processed_count = 0
         skipped_count = 0
+        last_completed = state.get('last_completed_date')
+        last_checkpoint_time = time.monotonic()
+        pending_checkpoint = False
         
         for date_dir in date_dirs:
-            sets_file = date_dir / 'sets.json'
-            if not sets_file.exists():
+            # Dates up to the checkpoint are already merged into the resumed state
+            if last_completed and date_dir.name <= last_completed:
                 continue
             
-            # Check if we need to process this file
-            if not self.should_process_file(sets_file, date_dir.name):
-                skipped_count += 1
-                continue
-                
-            processed_count += 1
-            with open(sets_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                
-            print(f"  Processing {len(data)} sets from {date_dir.name}")
+            date_processed, date_skipped = self.process_sets(date_dir, sets_data)
+            card_processed, card_skipped = self.process_cards(date_dir, cards_data)
+            date_processed += card_processed
+            date_skipped += card_skipped
             
-            for set_info in data:
-                set_id = set_info['id']
-                date_str = date_dir.name
-                
-                if set_id not in sets_data:
-                    # First time seeing this set
-                    sets_data[set_id] = {
-                        **set_info,
-                        'created_at': date_str,
-                        'updated_at': date_str
-                    }
-                else:
-                    # Update if data changed
-                    current_data = {k: v for k, v in set_info.items()}
-                    existing_data = {k: v for k, v in sets_data[set_id].items() 
-                                   if k not in ['created_at', 'updated_at']}
-                    
-                    if current_data != existing_data:
-                        sets_data[set_id].update(set_info)
-                        sets_data[set_id]['updated_at'] = date_str
+            processed_count += date_processed
+            skipped_count += date_skipped
+            
+            if date_processed > 0:
+                state['last_completed_date'] = date_dir.name
+                pending_checkpoint = True
+            
+            if pending_checkpoint and time.monotonic() - last_checkpoint_time >= self.checkpoint_interval:
+                self.save_checkpoint(state, sets_data, cards_data)
+                last_checkpoint_time = time.monotonic()
+                pending_checkpoint = False
         
         if skipped_count > 0:
-            print(f"  Skipped {skipped_count} unchanged sets files")
+            print(f"  Skipped {skipped_count} unchanged files")
         if processed_count > 0:
-            print(f"  Processed {processed_count} new/changed sets files")
-        print(f"  Saved {len(sets_data)} sets to sets.json")
-        return sets_data
+            print(f"  Processed {processed_count} new/changed files")
+        
+        total_cards = sum(len(data['cards']) for data in cards_data.values())
+        print(f"  Merged {len(sets_data)} sets and {total_cards} cards")
+        return sets_data, cards_data
+        
+    def process_sets(self, date_dir, sets_data):
+        """Merge one snapshot's sets.json into the consolidated metadata"""
+        sets_file = date_dir / 'sets.json'
+        if self.git_selection is not None and f"{date_dir.name}/sets.json" not in self.git_selection.get(date_dir.name, ()):
+            return 0, 0
+        if not sets_file.exists():
+            return 0, 0
+        
+        # Check if we need to process this file
+        if not self.should_process_file(sets_file, date_dir.name):
+            return 0, 1
+        
+        with open(sets_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+            
+        print(f"  Processing {len(data)} sets from {date_dir.name}")
+        
+        for set_info in data:
+            set_id = set_info['id']
+            date_str = date_dir.name
+            
+            if set_id not in sets_data:
+                # First time seeing this set
+                sets_data[set_id] = {
+                    **set_info,
+                    'created_at': date_str,
+                    'updated_at': date_str
+                }
+            else:
+                # Update if data changed
+                current_data = {k: v for k, v in set_info.items()}
+                existing_data = {k: v for k, v in sets_data[set_id].items() 
+                               if k not in ['created_at', 'updated_at']}
+                
+                if current_data != existing_data:
+                    sets_data[set_id].update(set_info)
+                    sets_data[set_id]['updated_at'] = date_str
+        
+        self.mark_file_processed(sets_file, date_dir.name)
+        return 1, 0
         
     def load_existing_sets_data(self):
         """Load existing processed sets data to preserve previous processing"""
@@ -302,80 +1208,75 @@ class LorcanaDataProcessor:
         
     def clean_card_for_processing(self, card):
         """Remove timestamps from card for processing (they'll be re-added)"""
-        clean_card = card.copy()
-        clean_card.pop('created_at', None)
-        clean_card.pop('updated_at', None)
-        return clean_card
-        
-    def process_cards(self):
-        """Process all card files and consolidate data"""
-        print("🃏 Step 2: Processing card data...")
-        
-        # Check if input directory exists
-        if not self.input_dir.exists():
-            print(f"⚠️ Input directory does not exist: {self.input_dir}")
-            print("   Creating empty processed data structure...")
-            return {}
+        return CompactCard.from_dict(card, skip_keys=('created_at', 'updated_at'))
         
-        # Load existing processed cards data
-        cards_data = self.load_existing_cards_data()
+    def process_cards(self, date_dir, cards_data):
+        """Merge one snapshot's card files into the consolidated card data"""
+        sets_dir = date_dir / 'sets'
+        if not sets_dir.exists():
+            return 0, 0
         
-        try:
-            date_dirs = sorted([d for d in self.input_dir.iterdir() if d.is_dir()])
-        except (FileNotFoundError, OSError) as e:
-            print(f"⚠️ Cannot access input directory: {e}")
-            print("   Creating empty processed data structure...")
-            return {}
         processed_count = 0
         skipped_count = 0
         
-        for date_dir in date_dirs:
-            sets_dir = date_dir / 'sets'
-            if not sets_dir.exists():
+        if self.git_selection is not None:
+            card_files = [self.input_dir / file_key for file_key in sorted(self.git_selection.get(date_dir.name, ()))
+                          if file_key != f"{date_dir.name}/sets.json"]
+            card_files = [card_file for card_file in card_files if card_file.exists()]
+        else:
+            card_files = sets_dir.glob('*.json')
+            
+        for card_file in card_files:
+            filename = card_file.stem
+            date_str = date_dir.name
+            
+            # Check if we need to process this file
+            if not self.should_process_file(card_file, date_str):
+                skipped_count += 1
                 continue
+            
+            processed_count += 1
+            
+            # Determine the set ID to use, preferring the one the extractor recorded
+            manifest_entry = self.get_manifest_entry(card_file) or {}
+            set_id = manifest_entry.get('set_id') or self.get_set_id_for_file(filename)
+            friendly_name = self.get_friendly_name(set_id)
+            
+            with open(card_file, 'r', encoding='utf-8') as f:
+                cards = json.load(f)
+            
+            expected_count = manifest_entry.get('card_count')
+            if expected_count is not None and expected_count != len(cards):
+                print(f"  ⚠️ {filename}: manifest lists {expected_count} cards but file has {len(cards)}")
+            
+            print(f"  Processing {filename} -> {set_id} ({friendly_name.replace('_', ' ').title()}): {len(cards)} cards")
+            
+            if set_id not in cards_data:
+                # First time seeing this set's cards
+                cards_data[set_id] = {
+                    'cards': [CompactCard.from_dict(card) for card in cards],
+                    'created_at': date_str,
+                    'updated_at': date_str
+                }
+            else:
+                # Merge cards and update timestamp if changed
+                existing_cards = cards_data[set_id]['cards']
+                merged_cards = self.merge_cards(existing_cards, cards, date_str)
                 
-            for card_file in sets_dir.glob('*.json'):
-                filename = card_file.stem
-                date_str = date_dir.name
-                
-                # Check if we need to process this file
-                if not self.should_process_file(card_file, date_str):
-                    skipped_count += 1
-                    continue
-                
-                processed_count += 1
-                
-                # Determine the set ID to use
-                set_id = self.get_set_id_for_file(filename)
-                friendly_name = self.get_friendly_name(set_id)
-                
-                with open(card_file, 'r', encoding='utf-8') as f:
-                    cards = json.load(f)
-                
-                print(f"  Processing {filename} -> {set_id} ({friendly_name.replace('_', ' ').title()}): {len(cards)} cards")
-                
-                if set_id not in cards_data:
-                    # First time seeing this set's cards
-                    cards_data[set_id] = {
-                        'cards': cards,
-                        'created_at': date_str,
-                        'updated_at': date_str
-                    }
-                else:
-                    # Merge cards and update timestamp if changed
-                    existing_cards = cards_data[set_id]['cards']
-                    merged_cards = self.merge_cards(existing_cards, cards, date_str)
-                    
-                    if len(merged_cards) != len(existing_cards):
-                        cards_data[set_id]['cards'] = merged_cards
-                        cards_data[set_id]['updated_at'] = date_str
-        
-        if skipped_count > 0:
-            print(f"  Skipped {skipped_count} unchanged card files")
-        if processed_count > 0:
-            print(f"  Processed {processed_count} new/changed card files")
+                if len(merged_cards) != len(existing_cards):
+                    # Only cards kept in the working set are converted to compact cards
+                    cards_data[set_id]['cards'] = [
+                        card if isinstance(card, CompactCard) else CompactCard.from_dict(card)
+                        for card in merged_cards
+                    ]
+                    cards_data[set_id]['updated_at'] = date_str
+            
+            self.mark_file_processed(card_file, date_str)
         
-        # Save individual card files
+        return processed_count, skipped_count
+    
+    def save_card_files(self, cards_data):
+        """Save one card file per set, adding timestamps to each card"""
         sets_dir = self.output_dir / 'sets'
         sets_dir.mkdir(exist_ok=True)
         
@@ -384,7 +1285,7 @@ class LorcanaDataProcessor:
             cards_with_timestamps = []
             for card in data['cards']:
                 card_with_timestamps = {
-                    **card,
+                    **card.to_dict(),
                     'created_at': data['created_at'],
                     'updated_at': data['updated_at']
                 }
@@ -398,10 +1299,57 @@ class LorcanaDataProcessor:
             friendly_name = self.get_friendly_name(set_id)
             print(f"  Saved {len(cards_with_timestamps)} cards for {set_id} ({friendly_name.replace('_', ' ').title()})")
         
+        # Save consolidated card store for single-card lookups
+        self.save_card_store(cards_data)
+        
         total_cards = sum(len(data['cards']) for data in cards_data.values())
         print(f"  Total cards processed: {total_cards}")
         
-        return cards_data
+    def save_card_store(self, cards_data):
+        """Save all cards as newline-delimited JSON plus an ID -> (offset, length) index"""
+        store_file = self.output_dir / 'cards.ndjson'
+        index_file = self.output_dir / 'cards_index.json'
+        temp_store = store_file.with_name(store_file.name + '.tmp')
+        temp_index = index_file.with_name(index_file.name + '.tmp')
+        
+        # A card ID held by more than one set keeps the most recently updated record
+        latest = {}
+        duplicates = set()
+        for set_id in sorted(cards_data):
+            data = cards_data[set_id]
+            for card in data['cards']:
+                card_id = card['id']
+                current = latest.get(card_id)
+                if current is not None:
+                    duplicates.add(card_id)
+                    if current[0]['updated_at'] >= data['updated_at']:
+                        continue
+                latest[card_id] = (data, card)
+
+        if duplicates:
+            print(f"  ⚠️  {len(duplicates)} card IDs appear in more than one set - keeping the latest updated record")
+
+        index = {}
+        offset = 0
+        with open(temp_store, 'wb') as f:
+            for card_id, (data, card) in latest.items():
+                record = {
+                    **card.to_dict(),
+                    'created_at': data['created_at'],
+                    'updated_at': data['updated_at']
+                }
+                line = json.dumps(record, ensure_ascii=False, separators=(',', ':')).encode('utf-8') + b'\n'
+                f.write(line)
+                index[card_id] = [offset, len(line)]
+                offset += len(line)
+        
+        # Store size lets readers detect an index that doesn't belong to the store
+        with open(temp_index, 'w', encoding='utf-8') as f:
+            json.dump({'store_size': offset, 'cards': index}, f, separators=(',', ':'))
+        
+        os.replace(temp_store, store_file)
+        os.replace(temp_index, index_file)
+        print(f"  Saved card store with {len(index)} cards to {store_file.name}")
         
     def get_set_id_for_file(self, filename):
         """Convert filename to standardized set ID"""
@@ -431,8 +1379,10 @@ class LorcanaDataProcessor:
         
     def merge_cards(self, existing_cards, new_cards, date_found=None):
         """Merge card lists, avoiding duplicates and tracking changes"""
-        # Create a lookup of existing cards by ID
-        existing_by_id = {card.get('id'): card for card in existing_cards}
+        # Create a lookup of new cards by ID (first occurrence wins on duplicates)
+        new_by_id = {}
+        for card in new_cards:
+            new_by_id.setdefault(card.get('id'), card)
         
         merged = []
         
@@ -440,7 +1390,7 @@ class LorcanaDataProcessor:
         for card in existing_cards:
             card_id = card.get('id')
             # Find matching card in new data
-            new_card = next((c for c in new_cards if c.get('id') == card_id), None)
+            new_card = new_by_id.get(card_id)
             
             if new_card and date_found:
                 # Compare and track changes
@@ -469,10 +1419,14 @@ class LorcanaDataProcessor:
         return merged
         
     def save_data(self, sets_data, cards_data):
-        """Save consolidated sets metadata"""
+        """Save consolidated sets metadata and per-set card files"""
+        print("💾 Step 2: Saving processed data...")
         sets_output = self.output_dir / 'sets.json'
         with open(sets_output, 'w', encoding='utf-8') as f:
             json.dump(sets_data, f, indent=2, ensure_ascii=False)
+        print(f"  Saved {len(sets_data)} sets to sets.json")
+        
+        self.save_card_files(cards_data)
         
     def create_report(self, sets_data, cards_data):
         """Create summary report"""
@@ -516,8 +1470,354 @@ class LorcanaDataProcessor:
         print("  Files created:")
         print("    - sets.json (metadata for all sets)")
         print(f"    - sets/ directory with {len(cards_data)} card files")
+        print("    - cards.ndjson + cards_index.json (card store for lookups by ID)")
         print("    - report.json (processing summary)")
 
+    def profile_card_memory(self):
+        """Compare traced memory of the processed cards held as dicts vs compact cards"""
+        print("🧪 Profiling card working set memory...")
+        
+        sets_dir = self.output_dir / 'sets'
+        card_files = sorted(sets_dir.glob('*.json')) if sets_dir.exists() else []
+        if not card_files:
+            print("❌ No processed card files found. Run the processor first.")
+            return
+        
+        # Read the files up front so only the card objects are traced
+        file_texts = [card_file.read_text(encoding='utf-8') for card_file in card_files]
+        
+        def as_dict(card):
+            # What the merge held per card before compact cards: a dict without timestamps
+            return {k: v for k, v in card.items() if k not in ('created_at', 'updated_at')}
+        
+        results = {}
+        for label, convert in [('dict', as_dict), ('compact', self.clean_card_for_processing)]:
+            tracemalloc.start()
+            cards = [convert(card) for text in file_texts for card in json.loads(text)]
+            current, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            del cards
+            
+            # Timed in a second pass without tracing, since tracemalloc slows allocation down
+            parsed = [json.loads(text) for text in file_texts]
+            start = time.perf_counter()
+            cards = [convert(card) for file_cards in parsed for card in file_cards]
+            elapsed = time.perf_counter() - start
+            results[label] = (len(cards), current, peak, elapsed)
+            del cards, parsed
+        
+        card_count = results['dict'][0]
+        print(f"  Cards: {card_count} from {len(card_files)} files")
+        for label, (_, current, peak, elapsed) in results.items():
+            print(f"  {label:<8} retained {current / 1024 / 1024:7.2f} MiB, peak {peak / 1024 / 1024:7.2f} MiB, "
+                  f"built in {elapsed * 1000:6.1f} ms")
+        saved = results['dict'][1] - results['compact'][1]
+        print(f"  Saved {saved / 1024 / 1024:.2f} MiB ({saved / results['dict'][1]:.0%} of dict working set)")
+    
+    def export_columnar(self, export_format='auto'):
+        """Export the merged catalog and raw snapshot history in a columnar format"""
+        print("📦 Exporting columnar data...")
+        
+        export_format = self.resolve_export_format(export_format)
+        if export_format is None:
+            print("❌ Columnar export requires pyarrow (Parquet) or numpy (.npz)")
+            return
+        
+        # Each format gets its own tree so readers never see mixed file types
+        export_dir = self.output_dir / 'columnar' / export_format
+        export_dir.mkdir(parents=True, exist_ok=True)
+        catalog_dir = export_dir / 'catalog'
+        history_dir = export_dir / 'history'
+        
+        # Export state lets repeated runs skip partitions that are already written
+        state_file = export_dir / 'export_state.json'
+        state = {}
+        if state_file.exists():
+            try:
+                with open(state_file, 'r', encoding='utf-8') as f:
+                    state = json.load(f)
+            except (json.JSONDecodeError, FileNotFoundError):
+                state = {}
+        if state.get('version') != COLUMNAR_EXPORT_VERSION:
+            if state:
+                print("  Export layout changed - rewriting every partition")
+            state = self.reset_export(catalog_dir, history_dir)
+        
+        catalog_files = self.get_pending_catalog_files(catalog_dir, state)
+        history_dates = self.get_pending_history_dates(history_dir, state)
+        
+        # Every partition shares one schema, so a legality format seen for the first time
+        # means rewriting the partitions written without its column
+        pending_files = [card_file for card_file, _ in catalog_files]
+        for date_dir in history_dates:
+            pending_files.extend(sorted((date_dir / 'sets').glob('*.json')))
+        new_formats = self.collect_legality_formats(pending_files) - set(state['legality_formats'])
+        if new_formats and (state['catalog'] or state['history']):
+            print(f"  New legality formats {', '.join(sorted(new_formats))} - rewriting every partition")
+            legality_formats = state['legality_formats']
+            state = self.reset_export(catalog_dir, history_dir)
+            state['legality_formats'] = legality_formats
+            catalog_files = self.get_pending_catalog_files(catalog_dir, state)
+            history_dates = self.get_pending_history_dates(history_dir, state)
+        state['legality_formats'] = sorted(set(state['legality_formats']) | new_formats)
+        columns = self.get_export_columns(state['legality_formats'])
+        
+        catalog_count = self.export_catalog_partitions(catalog_dir, catalog_files, columns, export_format, state)
+        self.save_export_state(state_file, state)
+        
+        history_count = 0
+        for date_dir in history_dates:
+            date_str = date_dir.name
+            self.export_history_partition(date_dir, history_dir / f"snapshot_date={date_str}", columns, export_format)
+            if date_str not in state['history']:
+                state['history'].append(date_str)
+            # Save after every date so an interrupted export keeps completed partitions
+            self.save_export_state(state_file, state)
+            history_count += 1
+        
+        print(f"  Format: {export_format}")
+        print(f"  Catalog partitions written: {catalog_count}")
+        print(f"  History date partitions written: {history_count}")
+        print(f"  Export location: {export_dir}")
+    
+    def reset_export(self, catalog_dir, history_dir):
+        """Remove every exported partition and return an empty export state"""
+        for partition_root in [catalog_dir, history_dir]:
+            if partition_root.exists():
+                shutil.rmtree(partition_root)
+        return {'version': COLUMNAR_EXPORT_VERSION, 'legality_formats': [], 'catalog': {}, 'history': []}
+    
+    def get_pending_catalog_files(self, catalog_dir, state):
+        """Get the processed per-set card files that changed since they were exported, with their hashes"""
+        sets_dir = self.output_dir / 'sets'
+        if not sets_dir.exists():
+            return []
+        
+        pending = []
+        for card_file in sorted(sets_dir.glob('*.json')):
+            current_hash = self.get_file_hash(card_file)
+            if state['catalog'].get(card_file.stem) == current_hash and catalog_dir.exists():
+                continue
+            pending.append((card_file, current_hash))
+        return pending
+    
+    def get_pending_history_dates(self, history_dir, state):
+        """Get the raw snapshot dates that have not been exported yet"""
+        if not self.input_dir.exists():
+            return []
+        return [date_dir for date_dir in self.get_date_dirs()
+                if not (date_dir.name in state['history'] and (history_dir / f"snapshot_date={date_dir.name}").exists())]
+    
+    def collect_legality_formats(self, card_files):
+        """Get every legality format named by the cards in the given files"""
+        formats = set()
+        for card_file in card_files:
+            try:
+                with open(card_file, 'r', encoding='utf-8') as f:
+                    cards = json.load(f)
+            except (json.JSONDecodeError, FileNotFoundError):
+                continue
+            for card in cards:
+                formats.update((card.get('legalities') or {}).keys())
+        return formats
+    
+    def resolve_export_format(self, export_format):
+        """Pick the columnar format to use based on installed libraries"""
+        if export_format == 'auto':
+            if pa is not None:
+                return 'parquet'
+            if np is not None:
+                return 'npz'
+            return None
+        if export_format == 'parquet' and pa is None:
+            return None
+        if export_format == 'npz' and np is None:
+            return None
+        return export_format
+    
+    def save_export_state(self, state_file, state):
+        """Save columnar export state"""
+        with open(state_file, 'w', encoding='utf-8') as f:
+            json.dump(state, f, indent=2, ensure_ascii=False)
+    
+    def export_catalog_partitions(self, catalog_dir, catalog_files, columns, export_format, state):
+        """Export the changed processed per-set card files"""
+        columns = columns + [('created_at', 'str'), ('updated_at', 'str')]
+        for card_file, current_hash in catalog_files:
+            with open(card_file, 'r', encoding='utf-8') as f:
+                cards = json.load(f)
+            
+            for set_id, set_cards in self.group_cards_by_set_id(cards, card_file.stem).items():
+                set_partition = catalog_dir / f"set_id={set_id}"
+                set_partition.mkdir(parents=True, exist_ok=True)
+                rows = [self.flatten_card(card) for card in set_cards]
+                self.write_columnar_file(rows, columns, set_partition / card_file.stem, export_format)
+            
+            state['catalog'][card_file.stem] = current_hash
+        
+        return len(catalog_files)
+    
+    def export_history_partition(self, date_dir, partition_dir, columns, export_format):
+        """Export every raw card file of one snapshot date, partitioned by set ID"""
+        # Drop anything an earlier, interrupted export of this date left behind
+        if partition_dir.exists():
+            shutil.rmtree(partition_dir)
+        partition_dir.mkdir(parents=True)
+        
+        sets_dir = date_dir / 'sets'
+        if not sets_dir.exists():
+            return
+        
+        print(f"  Exporting snapshot {date_dir.name}")
+        for card_file in sorted(sets_dir.glob('*.json')):
+            try:
+                with open(card_file, 'r', encoding='utf-8') as f:
+                    cards = json.load(f)
+            except (json.JSONDecodeError, FileNotFoundError):
+                continue
+            
+            manifest_entry = self.get_manifest_entry(card_file) or {}
+            default_set_id = manifest_entry.get('set_id') or self.get_set_id_for_file(card_file.stem)
+            for set_id, set_cards in self.group_cards_by_set_id(cards, default_set_id).items():
+                set_partition = partition_dir / f"set_id={set_id}"
+                set_partition.mkdir(parents=True, exist_ok=True)
+                rows = [self.flatten_card(card) for card in set_cards]
+                # Older snapshots may hold several source files for one set, so keep the source name
+                self.write_columnar_file(rows, columns, set_partition / card_file.stem, export_format)
+    
+    def group_cards_by_set_id(self, cards, default_set_id):
+        """Group cards by the set ID they carry, which becomes their partition key"""
+        groups = {}
+        for card in cards:
+            set_id = (card.get('set') or {}).get('id') or default_set_id
+            groups.setdefault(set_id, []).append(card)
+        return groups
+    
+    def get_export_columns(self, legality_formats):
+        """Build the column schema shared by every partition, including one column per legality format"""
+        return CARD_COLUMNS + [(f"legality_{fmt}", 'str') for fmt in legality_formats]
+    
+    def flatten_card(self, card):
+        """Flatten a nested card dict into a single row of typed values"""
+        set_info = card.get('set') or {}
+        prices = card.get('prices') or {}
+        card_inks = card.get('inks') or ([card['ink']] if card.get('ink') else [])
+        
+        row = {name: card.get(name) for name, _ in CARD_COLUMNS}
+        row.update({
+            'set_code': set_info.get('code'),
+            'set_name': set_info.get('name'),
+            'price_usd': self.parse_price(prices.get('usd')),
+            'price_usd_foil': self.parse_price(prices.get('usd_foil')),
+            'created_at': card.get('created_at'),
+            'updated_at': card.get('updated_at')
+        })
+        for ink in INK_COLORS:
+            row[f"ink_{ink.lower()}"] = ink in card_inks
+        for fmt, legality in (card.get('legalities') or {}).items():
+            row[f"legality_{fmt}"] = legality
+        return row
+    
+    def parse_price(self, value):
+        """Convert a price string to a float, or None when missing"""
+        try:
+            return float(value) if value is not None else None
+        except (TypeError, ValueError):
+            return None
+    
+    def write_columnar_file(self, rows, columns, base_path, export_format):
+        """Write rows as one Parquet or .npz file, replacing it atomically"""
+        values = {name: [row.get(name) for row in rows] for name, _ in columns}
+        
+        if export_format == 'parquet':
+            arrow_types = {
+                'str': pa.string(), 'int': pa.int64(), 'float': pa.float64(),
+                'bool': pa.bool_(), 'list': pa.list_(pa.string())
+            }
+            table = pa.table({
+                name: pa.array(values[name], type=arrow_types[kind]) for name, kind in columns
+            })
+            target = base_path.with_name(base_path.name + '.parquet')
+            temp = target.with_name(target.name + '.tmp')
+            pq.write_table(table, str(temp))
+        else:
+            # NumPy has no nulls: ints/floats use NaN, strings use '' and lists are '|'-joined
+            arrays = {}
+            for name, kind in columns:
+                column = values[name]
+                if kind in ('int', 'float'):
+                    arrays[name] = np.array([np.nan if v is None else v for v in column], dtype=np.float64)
+                elif kind == 'bool':
+                    arrays[name] = np.array([bool(v) for v in column], dtype=bool)
+                elif kind == 'list':
+                    arrays[name] = np.array(['|'.join(v or []) for v in column], dtype=str)
+                else:
+                    arrays[name] = np.array(['' if v is None else str(v) for v in column], dtype=str)
+            target = base_path.with_name(base_path.name + '.npz')
+            temp = target.with_name(target.name + '.tmp')
+            with open(temp, 'wb') as f:
+                np.savez_compressed(f, **arrays)
+        
+        os.replace(temp, target)
+
+
+class LorcanaCardStore:
+    """Random access to processed cards by ID via the consolidated card store"""
+    
+    def __init__(self, data_dir='data/processed/lorcast'):
+        self.data_dir = Path(data_dir)
+        self.store_file = self.data_dir / 'cards.ndjson'
+        self.index_file = self.data_dir / 'cards_index.json'
+        
+        with open(self.index_file, 'r', encoding='utf-8') as f:
+            index_data = json.load(f)
+        self.index = index_data['cards']
+        
+        self._file = open(self.store_file, 'rb')
+        store_size = os.fstat(self._file.fileno()).st_size
+        if store_size != index_data['store_size']:
+            self._file.close()
+            raise ValueError(f"Card index does not match {self.store_file} - reprocess the data")
+        
+        # mmap can't map an empty file
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if store_size else None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def __contains__(self, card_id):
+        return card_id in self.index
+    
+    def __len__(self):
+        return len(self.index)
+    
+    def close(self):
+        """Release the memory map and file handle"""
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        self._file.close()
+    
+    def get(self, card_id):
+        """Return the card with the given ID, or None if it is not in the store"""
+        entry = self.index.get(card_id)
+        if entry is None:
+            return None
+        offset, length = entry
+        return json.loads(self._mmap[offset:offset + length])
+    
+    def get_many(self, card_ids):
+        """Return a dict of card ID -> card for every ID found in the store"""
+        cards = {}
+        for card_id in card_ids:
+            card = self.get(card_id)
+            if card is not None:
+                cards[card_id] = card
+        return cards
+
 
 class LorcanaDataInspector:
     """Simple data inspector for viewing processed Lorcana data"""
@@ -609,8 +1909,117 @@ class LorcanaDataInspector:
             if len(cards) > 5:
                 print(f"  ... and {len(cards) - 5} more cards")
     
+    def show_card(self, card_id):
+        """Show a single card looked up by ID from the card store"""
+        try:
+            store = LorcanaCardStore(self.data_dir)
+        except FileNotFoundError:
+            print("❌ No card store found. Run the processor first.")
+            return
+        except ValueError as e:
+            print(f"❌ {e}")
+            return
+        
+        with store:
+            card = store.get(card_id)
+        
+        if card is None:
+            print(f"❌ Card {card_id} not found.")
+            return
+        
+        set_info = card.get('set') or {}
+        print(f"🃏 {card.get('name', 'Unknown')} - {card.get('version', '')}")
+        print("=" * 50)
+        print(f"Card ID: {card_id}")
+        print(f"Set: {set_info.get('name', 'Unknown')} ({set_info.get('id', 'N/A')})")
+        print(f"Number: {card.get('collector_number', 'N/A')}")
+        print(f"Rarity: {card.get('rarity', 'N/A')}")
+        print(f"Ink: {card.get('ink') or ', '.join(card.get('inks') or []) or 'N/A'}")
+        print(f"Cost: {card.get('cost', 'N/A')}")
+        if card.get('text'):
+            print(f"Text: {card['text']}")
+        prices = card.get('prices') or {}
+        if prices:
+            print(f"Prices: {', '.join(f'{k}={v}' for k, v in prices.items())}")
+        print(f"Created: {card.get('created_at', 'Unknown')}")
+        print(f"Updated: {card.get('updated_at', 'Unknown')}")
+    
+    def load_change_rollups(self):
+        """Load the processor's change rollups, or None if they haven't been built"""
+        rollups_file = self.data_dir / 'change_rollups.json'
+        if not rollups_file.exists():
+            return None
+        
+        try:
+            with open(rollups_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (json.JSONDecodeError, FileNotFoundError):
+            return None
+    
+    def show_changes_by_date(self, limit=10):
+        """Show change counts per snapshot date from the rollups"""
+        rollups = self.load_change_rollups()
+        if rollups is None:
+            print("❌ No change rollups found. Process data first to track changes.")
+            return
+        
+        print(f"📅 Changes by Date (Latest {limit})")
+        print("=" * 50)
+        for date, date_rollup in list(rollups['by_date'].items())[-limit:]:
+            fields = sorted(date_rollup['fields'].items(), key=lambda x: x[1], reverse=True)
+            field_summary = ', '.join(f"{field}: {count}" for field, count in fields[:5])
+            print(f"   {self.format_rollup_date(date)}: {date_rollup['total']} changes ({field_summary})")
+    
+    def show_field_changes(self, field, limit=10):
+        """Show rollups for a single changed field, including largest moves for prices"""
+        rollups = self.load_change_rollups()
+        if rollups is None:
+            print("❌ No change rollups found. Process data first to track changes.")
+            return
+        
+        total = rollups['by_field'].get(field, 0)
+        print(f"🔎 Changes to '{field}': {total} total")
+        print("=" * 50)
+        if not total:
+            return
+        
+        print(f"\n📅 By Date (Latest {limit}):")
+        field_dates = [(date, date_rollup['fields'][field]) for date, date_rollup in rollups['by_date'].items()
+                       if field in date_rollup['fields']]
+        for date, count in field_dates[-limit:]:
+            print(f"   {self.format_rollup_date(date)}: {count} changes")
+        
+        if field == 'prices':
+            print(f"\n💰 Largest Price Moves (Top {limit}):")
+            for i, move in enumerate(rollups['price_moves'][:limit], 1):
+                when = f"range over {move['period']} (monthly summary)" if move.get('period') else f"on {move['date']}"
+                print(f"   {i}. {move['card_name'] or move['card_id']} [{move['price']}] "
+                      f"{move['old']:.2f} -> {move['new']:.2f} ({move['delta']:+.2f}) {when}")
+    
+    def format_rollup_date(self, date):
+        """Label a rollup date bucket; month buckets hold price changes folded into monthly summaries"""
+        return f"{date} (folded monthly)" if len(date) == 7 else date
+    
+    def show_top_changed_cards(self, limit=10):
+        """Show the most changed cards from the rollups"""
+        rollups = self.load_change_rollups()
+        if rollups is None:
+            print("❌ No change rollups found. Process data first to track changes.")
+            return
+        
+        print(f"🔥 Most Changed Cards (Top {limit}):")
+        for i, entry in enumerate(rollups['top_cards'][:limit], 1):
+            print(f"   {i}. {entry['card_name'] or entry['card_id']} ({entry['changes']} changes)")
+    
     def show_card_changes(self, card_name=None, limit=10):
         """Show card changes over time"""
+        if not card_name:
+            # The summary can be answered from the rollups without loading every change
+            rollups = self.load_change_rollups()
+            if rollups is not None:
+                self.show_rollup_summary(rollups, limit)
+                return
+        
         changes_file = self.data_dir / 'card_changes.json'
         
         if not changes_file.exists():
@@ -677,19 +2086,54 @@ class LorcanaDataInspector:
                     field = change.get('field', 'unknown')
                     change_types[field] = change_types.get(field, 0) + 1
             
-            print(f"\n📊 Change Types:")
+            print("\n📊 Change Types:")
             for field, count in sorted(change_types.items(), key=lambda x: x[1], reverse=True):
                 print(f"   {field}: {count} changes")
+    
+    def show_rollup_summary(self, rollups, limit=10):
+        """Show the overall card changes summary from the rollups"""
+        if not rollups['total_changes']:
+            print("📝 No card changes recorded yet.")
+            return
+        
+        print("🔄 Card Changes Summary")
+        print("=" * 50)
+        print(f"📊 Total cards with changes: {rollups['total_cards']}")
+        print(f"📊 Total changes recorded: {rollups['total_changes']}")
+        
+        print(f"\n🔥 Most Changed Cards (Top {limit}):")
+        for i, entry in enumerate(rollups['top_cards'][:limit], 1):
+            print(f"   {i}. {entry['card_name'] or 'Unknown Card'} ({entry['changes']} changes)")
+        
+        print("\n📊 Change Types:")
+        for field, count in sorted(rollups['by_field'].items(), key=lambda x: x[1], reverse=True):
+            print(f"   {field}: {count} changes")
 
 
 def main():
     """Main function with command line interface"""
     parser = argparse.ArgumentParser(description='Lorcana Data Processor and Inspector')
-    parser.add_argument('action', choices=['process', 'inspect', 'details', 'changes', 'force-process'], 
+    parser.add_argument('action', choices=['process', 'inspect', 'details', 'changes', 'force-process',
+                                           'export-columnar', 'card', 'profile-memory', 'compact-changes'], 
                        help='Action to perform')
     parser.add_argument('--set-id', help='Set ID for details view')
+    parser.add_argument('--id', dest='card_id', help='Card ID for card lookup (e.g. crd_...)')
     parser.add_argument('--card-name', help='Card name to search for changes')
+    parser.add_argument('--by-date', action='store_true', help='Show change counts per date (changes action)')
+    parser.add_argument('--field', help='Show rollups for one changed field, e.g. prices (changes action)')
+    parser.add_argument('--top', action='store_true', help='Show the most changed cards (changes action)')
     parser.add_argument('--limit', type=int, default=10, help='Limit number of results')
+    parser.add_argument('--resume', action='store_true',
+                       help='Resume an interrupted process/force-process run from its last checkpoint')
+    parser.add_argument('--git-diff', action='store_true',
+                       help='Only process raw files git reports as added/modified since the last processed commit')
+    parser.add_argument('--retention-days', type=int, default=PRICE_RETENTION_DAYS,
+                       help=f'Fold price changes older than this into monthly summaries '
+                            f'(default: {PRICE_RETENTION_DAYS}, 0 = keep all)')
+    parser.add_argument('--checkpoint-interval', type=float, default=0.0,
+                       help='Minimum seconds between processing checkpoints (default: 0 = after every snapshot)')
+    parser.add_argument('--format', choices=['auto', 'parquet', 'npz'], default='auto',
+                       help='Columnar export format (default: auto, Parquet if pyarrow is installed)')
     parser.add_argument('--input-dir', default='data/raw/lorcast',
                        help='Input directory (default: data/raw/lorcast)')
     parser.add_argument('--output-dir', default='data/processed/lorcast',
@@ -698,12 +2142,14 @@ def main():
     args = parser.parse_args()
     
     if args.action == 'process':
-        processor = LorcanaDataProcessor(args.input_dir, args.output_dir)
-        processor.run()
+        processor = LorcanaDataProcessor(args.input_dir, args.output_dir, args.checkpoint_interval,
+                                         args.retention_days)
+        processor.run(resume=args.resume, use_git=args.git_diff)
     elif args.action == 'force-process':
-        processor = LorcanaDataProcessor(args.input_dir, args.output_dir)
+        processor = LorcanaDataProcessor(args.input_dir, args.output_dir, args.checkpoint_interval,
+                                         args.retention_days)
         processor.force_reprocess()
-        processor.run()
+        processor.run(resume=args.resume, use_git=args.git_diff)
     elif args.action == 'inspect':
         inspector = LorcanaDataInspector(args.output_dir)
         inspector.show_data_summary()
@@ -715,12 +2161,33 @@ def main():
         inspector.show_set_details(args.set_id)
     elif args.action == 'changes':
         inspector = LorcanaDataInspector(args.output_dir)
-        inspector.show_card_changes(args.card_name, args.limit)
+        if args.by_date:
+            inspector.show_changes_by_date(args.limit)
+        elif args.field:
+            inspector.show_field_changes(args.field, args.limit)
+        elif args.top:
+            inspector.show_top_changed_cards(args.limit)
+        else:
+            inspector.show_card_changes(args.card_name, args.limit)
+    elif args.action == 'card':
+        if not args.card_id:
+            print("❌ --id required for card action")
+            return
+        inspector = LorcanaDataInspector(args.output_dir)
+        inspector.show_card(args.card_id)
+    elif args.action == 'compact-changes':
+        processor = LorcanaDataProcessor(args.input_dir, args.output_dir, retention_days=args.retention_days)
+        processor.compact_changes_file()
+    elif args.action == 'profile-memory':
+        processor = LorcanaDataProcessor(args.input_dir, args.output_dir)
+        processor.profile_card_memory()
+    elif args.action == 'export-columnar':
+        processor = LorcanaDataProcessor(args.input_dir, args.output_dir)
+        processor.export_columnar(args.format)
 
 
 if __name__ == "__main__":
     # If no command line arguments, run processor by default
-    import sys
     if len(sys.argv) == 1:
         # Check if we're in a non-interactive environment (like GitHub Actions)
         try:
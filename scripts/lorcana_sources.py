@@ -0,0 +1,334 @@
+import json
+import shutil
+import hashlib
+import argparse
+from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+from pathlib import Path
+
+from lorcana_data_processor import LorcanaDataProcessor, LorcanaCardStore
+
+# Repository root (parent of the scripts directory)
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# Bump when the identity index layout changes so old indexes are rebuilt from the card stores
+IDENTITY_INDEX_VERSION = 2
+
+# Game attributes compared across sources; IDs, prices and URIs are provider specific
+RECONCILED_FIELDS = [
+    'cost', 'ink', 'inks', 'inkwell', 'strength', 'willpower', 'lore', 'move_cost',
+    'text', 'rarity', 'type', 'classifications', 'keywords'
+]
+
+
+class CardSource(ABC):
+    """Base adapter for a card data provider
+
+    A source extracts snapshots into data/raw/<name>/<date>/ using the common
+    layout (sets.json plus sets/<set_id>.json holding card dicts with id, name,
+    version and set) and merges them into data/processed/<name>/.
+    """
+    name = None
+
+    def __init__(self, data_root=REPO_ROOT / 'data'):
+        self.data_root = Path(data_root)
+        self.raw_dir = self.data_root / 'raw' / self.name
+        self.processed_dir = self.data_root / 'processed' / self.name
+
+    @abstractmethod
+    def extract(self, snapshot_dir):
+        """Write one snapshot of the provider's sets and cards to snapshot_dir"""
+
+    def create_processor(self):
+        """Create the processor that merges this source's snapshots"""
+        return LorcanaDataProcessor(self.raw_dir, self.processed_dir)
+
+    def card_identity(self, card):
+        """Get the source-independent identity of a printing: name + version + set code + collector number"""
+        set_info = card.get('set') or {}
+        # Enchanted and promo reprints share name, version and set, so the collector number tells them apart
+        parts = [card.get('name'), card.get('version'), set_info.get('code'), card.get('collector_number')]
+        return '|'.join(str(part or '').strip().lower() for part in parts)
+
+
+class LorcastSource(CardSource):
+    """Cards from the Lorcast API, via inkcollector"""
+    name = 'lorcast'
+
+    def extract(self, snapshot_dir):
+        # Imported here so offline sources don't need inkcollector installed
+        from lorcana_data_extractor import LorcanaExtractor
+
+        extractor = LorcanaExtractor(output_dir=str(snapshot_dir))
+        extractor.extract_all_sets_and_cards()
+
+
+class FileSource(CardSource):
+    """Cards copied from a local snapshot directory; used for offline runs and tests"""
+
+    def __init__(self, name, source_dir, data_root=REPO_ROOT / 'data'):
+        self.name = name
+        self.source_dir = Path(source_dir)
+        super().__init__(data_root)
+
+    def extract(self, snapshot_dir):
+        if not (self.source_dir / 'sets.json').exists():
+            raise FileNotFoundError(f"No sets.json in {self.source_dir}")
+        shutil.copytree(self.source_dir, snapshot_dir, dirs_exist_ok=True)
+        print(f"Copied {self.source_dir} to {snapshot_dir}")
+
+
+# Sources that can be selected by name from the command line
+SOURCES = {
+    'lorcast': LorcastSource
+}
+
+
+def run_source_pipeline(source, extract=True, process=True):
+    """Extract and merge one source; runs in its own worker process"""
+    if extract:
+        snapshot_dir = source.raw_dir / datetime.now().strftime('%Y-%m-%d')
+        print(f"📥 [{source.name}] Extracting to {snapshot_dir}")
+        source.extract(snapshot_dir)
+
+    if process:
+        print(f"🔄 [{source.name}] Processing {source.raw_dir}")
+        processor = source.create_processor()
+        processor.run()
+
+    return source.name
+
+
+class CardIdentityIndex:
+    """Cross-source index of card printings keyed by name + version + set code + collector number
+
+    Each source's processed card store is read only when it changed since the
+    last update, and a card seen by several sources is reconciled only when
+    one of its sources' versions changed.
+    """
+
+    def __init__(self, index_file):
+        self.index_file = Path(index_file)
+        # The index lives next to the sources' processed directories
+        self.processed_root = self.index_file.parent
+        self.index = self.load_index()
+        # Identities whose per-source versions changed, plus any a previous update couldn't reconcile
+        self.dirty = set(self.index.get('pending', []))
+
+    def load_index(self):
+        """Load the identity index, or start an empty one"""
+        if self.index_file.exists():
+            try:
+                with open(self.index_file, 'r', encoding='utf-8') as f:
+                    index = json.load(f)
+                if index.get('version') == IDENTITY_INDEX_VERSION:
+                    return index
+                print("ℹ️ Identity index has an old layout - rebuilding it")
+            except (json.JSONDecodeError, FileNotFoundError):
+                pass
+        return {'version': IDENTITY_INDEX_VERSION, 'sources': {}, 'cards': {}, 'conflicts': {}, 'pending': []}
+
+    def save_index(self):
+        """Save the identity index"""
+        self.index_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.index_file, 'w', encoding='utf-8') as f:
+            json.dump(self.index, f, indent=2, ensure_ascii=False)
+
+    def get_card_hash(self, card):
+        """Hash the reconciled fields of a card"""
+        values = {field: card.get(field) for field in RECONCILED_FIELDS}
+        return hashlib.sha1(json.dumps(values, sort_keys=True).encode('utf-8')).hexdigest()
+
+    def update_source(self, source):
+        """Index a source's processed cards, skipping it if its card store is unchanged"""
+        store_file = source.processed_dir / 'cards.ndjson'
+        if not store_file.exists():
+            print(f"  [{source.name}] No card store found - skipping")
+            return
+
+        # The processor rewrites the store on every run, so only its content tells whether it changed
+        sha256 = hashlib.sha256()
+        with open(store_file, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                sha256.update(block)
+        signature = f"sha256:{sha256.hexdigest()}"
+        if self.index['sources'].get(source.name) == signature:
+            print(f"  [{source.name}] Unchanged since last index update")
+            return
+
+        # A source can still list more than one printing under an identity, so each entry is a list
+        printings = {}
+        with open(store_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                card = json.loads(line)
+                printings.setdefault(source.card_identity(card), []).append(
+                    {'id': card['id'], 'hash': self.get_card_hash(card)})
+
+        for key, entry in printings.items():
+            entry.sort(key=lambda printing: printing['id'])
+            entries = self.index['cards'].setdefault(key, {})
+            if entries.get(source.name) != entry:
+                self.dirty.add(key)
+            entries[source.name] = entry
+
+        # Drop cards the source no longer has
+        for key, entries in self.index['cards'].items():
+            if source.name in entries and key not in printings:
+                del entries[source.name]
+                self.dirty.add(key)
+
+        self.index['sources'][source.name] = signature
+        card_count = sum(len(entry) for entry in printings.values())
+        print(f"  [{source.name}] Indexed {card_count} cards under {len(printings)} identities")
+
+    def get_entry_hashes(self, entry):
+        """Get the distinct card hashes of a source's printings under one identity"""
+        return tuple(sorted({printing['hash'] for printing in entry}))
+
+    def open_store(self, stores, source_name):
+        """Open a source's processed card store once, or None if it can't be read"""
+        if source_name not in stores:
+            try:
+                stores[source_name] = LorcanaCardStore(self.processed_root / source_name)
+            except (OSError, ValueError, KeyError) as e:
+                print(f"  [{source_name}] Card store unavailable ({e}) - keeping its recorded conflicts")
+                stores[source_name] = None
+        return stores[source_name]
+
+    def load_cards(self, stores, entries):
+        """Read every source's printings of one identity, or None if any of them can't be read"""
+        cards = {}
+        for source_name, entry in entries.items():
+            store = self.open_store(stores, source_name)
+            if store is None:
+                return None
+            printings = [store.get(printing['id']) for printing in entry]
+            if None in printings:
+                return None
+            cards[source_name] = printings
+        return cards
+
+    def reconcile(self):
+        """Diff the changed identities that more than one source has, once per identity"""
+        stores = {}
+        reconciled = 0
+        pending = []
+
+        try:
+            for key in sorted(self.dirty):
+                entries = self.index['cards'].get(key, {})
+                if not entries:
+                    self.index['cards'].pop(key, None)
+                    self.index['conflicts'].pop(key, None)
+                    continue
+                if len(entries) < 2 or len({self.get_entry_hashes(entry) for entry in entries.values()}) == 1:
+                    self.index['conflicts'].pop(key, None)
+                    continue
+
+                # Only identities whose sources disagree need the full cards, from every source that has them
+                cards = self.load_cards(stores, entries)
+                if cards is None:
+                    # A source's cards couldn't be read; keep the recorded conflicts and retry next update
+                    pending.append(key)
+                    continue
+
+                conflicts = self.diff_cards(cards)
+                if conflicts:
+                    self.index['conflicts'][key] = conflicts
+                else:
+                    self.index['conflicts'].pop(key, None)
+                reconciled += 1
+        finally:
+            for store in stores.values():
+                if store is not None:
+                    store.close()
+
+        shared = sum(1 for entries in self.index['cards'].values() if len(entries) > 1)
+        print(f"  Cards in more than one source: {shared}")
+        print(f"  Reconciled {reconciled} changed cards, {len(self.index['conflicts'])} with conflicts")
+        if pending:
+            print(f"  {len(pending)} changed cards left to reconcile once their sources' stores can be read")
+        self.index['pending'] = pending
+        self.dirty = set()
+
+    def diff_cards(self, cards):
+        """Get the reconciled fields whose values differ between sources
+
+        cards maps a source name to its printings under one identity; a source
+        with several printings is compared on the set of values they hold.
+        """
+        conflicts = {}
+        for field in RECONCILED_FIELDS:
+            values = {}
+            encoded = set()
+            for source_name, printings in cards.items():
+                distinct = sorted({json.dumps(card.get(field), sort_keys=True) for card in printings})
+                encoded.add(tuple(distinct))
+                values[source_name] = printings[0].get(field) if len(distinct) == 1 else [json.loads(v) for v in distinct]
+            if len(encoded) > 1:
+                conflicts[field] = values
+        return conflicts
+
+
+def run_sources(sources, extract=True, process=True, workers=None, data_root=REPO_ROOT / 'data'):
+    """Run every source's pipeline in parallel, then update the cross-source identity index"""
+    print(f"🚀 Running {len(sources)} sources: {', '.join(source.name for source in sources)}")
+
+    failed = []
+    with ProcessPoolExecutor(max_workers=workers or len(sources)) as executor:
+        futures = {executor.submit(run_source_pipeline, source, extract, process): source for source in sources}
+        for future in as_completed(futures):
+            source = futures[future]
+            try:
+                future.result()
+                print(f"✅ [{source.name}] Pipeline complete")
+            except Exception as e:
+                failed.append(source.name)
+                print(f"❌ [{source.name}] Pipeline failed: {e}")
+
+    print("🔗 Updating cross-source card identity index...")
+    identity_index = CardIdentityIndex(Path(data_root) / 'processed' / 'card_identity_index.json')
+    for source in sources:
+        if source.name not in failed:
+            identity_index.update_source(source)
+    identity_index.reconcile()
+    identity_index.save_index()
+
+    return failed
+
+
+def main():
+    """Main function with command line interface"""
+    parser = argparse.ArgumentParser(description='Run Lorcana card data sources in parallel')
+    parser.add_argument('--source', action='append', choices=sorted(SOURCES),
+                       help='Registered source to run (repeatable, default: lorcast)')
+    parser.add_argument('--file-source', action='append', default=[], metavar='NAME=DIR',
+                       help='Offline source copying snapshots from a local directory (repeatable)')
+    parser.add_argument('--skip-extract', action='store_true', help='Only merge already extracted snapshots')
+    parser.add_argument('--skip-process', action='store_true', help='Only extract new snapshots')
+    parser.add_argument('--workers', type=int, help='Number of parallel source pipelines (default: one per source)')
+    parser.add_argument('--data-root', default=str(REPO_ROOT / 'data'),
+                       help='Root data directory holding raw/ and processed/ (default: repository data/)')
+
+    args = parser.parse_args()
+
+    source_names = args.source or ([] if args.file_source else ['lorcast'])
+    sources = [SOURCES[name](args.data_root) for name in source_names]
+    for file_source in args.file_source:
+        name, _, source_dir = file_source.partition('=')
+        if not name or not source_dir:
+            parser.error(f"--file-source expects NAME=DIR, got '{file_source}'")
+        sources.append(FileSource(name, source_dir, args.data_root))
+
+    names = [source.name for source in sources]
+    if len(set(names)) != len(names):
+        parser.error("Source names must be unique")
+
+    failed = run_sources(sources, not args.skip_extract, not args.skip_process, args.workers, args.data_root)
+    if failed:
+        raise SystemExit(f"Failed sources: {', '.join(failed)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+import json
+
+from lorcana_data_processor import LorcanaDataProcessor, LorcanaCardStore
+
+
+def write_snapshot(raw_dir, date, set_files):
+    """Write a raw snapshot holding one card file per set ID"""
+    sets_dir = raw_dir / date / 'sets'
+    sets_dir.mkdir(parents=True)
+    (raw_dir / date / 'sets.json').write_text(json.dumps([{'id': set_id, 'name': set_id, 'code': set_id[-1]} for set_id in set_files]))
+    for set_id, cards in set_files.items():
+        (sets_dir / f"{set_id}.json").write_text(json.dumps(cards))
+
+
+def card(card_id, usd):
+    return {'id': card_id, 'name': 'Elsa', 'version': 'Snow Queen', 'prices': {'usd': usd}}
+
+
+def test_store_matches_latest_set_file_for_duplicate_ids(tmp_path):
+    raw_dir = tmp_path / 'raw'
+    processed_dir = tmp_path / 'processed'
+    # The stale copy lives in the set ID that sorts last
+    write_snapshot(raw_dir, '2025-05-11', {'set_z': [card('crd_1', '0.52')]})
+    write_snapshot(raw_dir, '2025-08-29', {'set_a': [card('crd_1', '0.37'), card('crd_2', '1.00')]})
+
+    LorcanaDataProcessor(raw_dir, processed_dir).run()
+
+    with open(processed_dir / 'sets' / 'set_a.json', encoding='utf-8') as f:
+        current = {c['id']: c for c in json.load(f)}
+    with LorcanaCardStore(processed_dir) as store:
+        assert len(store) == 2
+        for card_id, expected in current.items():
+            assert store.get(card_id) == expected
+        assert store.get('crd_1')['updated_at'] == '2025-08-29'
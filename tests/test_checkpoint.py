@@ -0,0 +1,85 @@
+import os
+import json
+
+import pytest
+
+from lorcana_data_processor import LorcanaDataProcessor
+
+
+def write_snapshot(raw_dir, date, cards):
+    """Write a raw snapshot holding a single set"""
+    sets_dir = raw_dir / date / 'sets'
+    sets_dir.mkdir(parents=True)
+    (raw_dir / date / 'sets.json').write_text(json.dumps([{'id': 'set_t', 'name': 'Test Set', 'code': 'T'}]))
+    (sets_dir / 'set_t.json').write_text(json.dumps(cards))
+
+
+def card(text):
+    return {'id': 'crd_1', 'name': 'Elsa', 'version': 'Snow Queen', 'cost': 3, 'text': text}
+
+
+def crash(*args):
+    raise RuntimeError('crashed while saving')
+
+
+@pytest.mark.parametrize('resume', [True, False])
+def test_crash_while_saving_keeps_changes(tmp_path, monkeypatch, resume):
+    raw_dir = tmp_path / 'raw'
+    processed_dir = tmp_path / 'processed'
+    write_snapshot(raw_dir, '2025-05-11', [card('Shift 5')])
+    LorcanaDataProcessor(raw_dir, processed_dir).run()
+
+    write_snapshot(raw_dir, '2025-05-14', [card('Shift 4')])
+    with monkeypatch.context() as patch:
+        patch.setattr(LorcanaDataProcessor, 'save_card_changes', crash)
+        with pytest.raises(RuntimeError):
+            LorcanaDataProcessor(raw_dir, processed_dir).run()
+
+    # The crash left the errata only in the checkpoint, and no file marked as merged
+    assert (processed_dir / 'processing_checkpoint.json').exists()
+    with open(processed_dir / 'processing_history.json', encoding='utf-8') as f:
+        assert not any(key.startswith('2025-05-14') for key in json.load(f))
+
+    LorcanaDataProcessor(raw_dir, processed_dir).run(resume=resume)
+
+    with open(processed_dir / 'card_changes.json', encoding='utf-8') as f:
+        changes = json.load(f)['crd_1']['changes']
+    assert [(c['field'], c['old_value'], c['new_value'], c['date']) for c in changes] == [
+        ('text', 'Shift 5', 'Shift 4', '2025-05-14')
+    ]
+    with open(processed_dir / 'processing_history.json', encoding='utf-8') as f:
+        assert any(key.startswith('2025-05-14') for key in json.load(f))
+    assert not (processed_dir / 'processing_checkpoint.json').exists()
+
+
+def test_resume_after_fresh_checkout(tmp_path, monkeypatch, capsys):
+    raw_dir = tmp_path / 'raw'
+    processed_dir = tmp_path / 'processed'
+    write_snapshot(raw_dir, '2025-05-11', [card('Shift 5')])
+    LorcanaDataProcessor(raw_dir, processed_dir).run()
+
+    write_snapshot(raw_dir, '2025-05-14', [card('Shift 4')])
+    write_snapshot(raw_dir, '2025-05-21', [card('Shift 3')])
+    process_cards = LorcanaDataProcessor.process_cards
+
+    def crash_on_last_date(self, date_dir, cards_data):
+        if date_dir.name == '2025-05-21':
+            raise RuntimeError('job timed out')
+        return process_cards(self, date_dir, cards_data)
+
+    with monkeypatch.context() as patch:
+        patch.setattr(LorcanaDataProcessor, 'process_cards', crash_on_last_date)
+        with pytest.raises(RuntimeError):
+            LorcanaDataProcessor(raw_dir, processed_dir).run()
+
+    # A checkout gives every file a new mtime
+    for path in list(processed_dir.iterdir()) + list(raw_dir.rglob('*.json')):
+        os.utime(path, (path.stat().st_atime, path.stat().st_mtime + 3600))
+    capsys.readouterr()
+
+    LorcanaDataProcessor(raw_dir, processed_dir).run(resume=True)
+
+    assert 'Resuming after snapshot 2025-05-14' in capsys.readouterr().out
+    with open(processed_dir / 'card_changes.json', encoding='utf-8') as f:
+        changes = json.load(f)['crd_1']['changes']
+    assert [c['date'] for c in changes] == ['2025-05-14', '2025-05-21']
@@ -0,0 +1,136 @@
+import copy
+import json
+
+from lorcana_data_processor import LorcanaDataProcessor
+
+
+def price_change(date, old_usd, new_usd):
+    return {'date': date, 'field': 'prices', 'old_value': {'usd': old_usd}, 'new_value': {'usd': new_usd},
+            'timestamp': f"{date}T00:00:00"}
+
+
+def change(date, field, old_value, new_value):
+    return {'date': date, 'field': field, 'old_value': old_value, 'new_value': new_value,
+            'timestamp': f"{date}T00:00:00"}
+
+
+def make_processor(tmp_path, changes, retention_days=180):
+    processor = LorcanaDataProcessor(tmp_path / 'raw', tmp_path / 'processed', retention_days=retention_days)
+    processor.card_changes = {'crd_1': {'card_name': 'Elsa - Snow Queen', 'changes': changes}}
+    return processor
+
+
+def test_old_prices_fold_into_monthly_summaries(tmp_path):
+    # 2025-12-01 - 180 days falls in June, so January and February are folded
+    processor = make_processor(tmp_path, [
+        price_change('2025-01-05', '1.00', '1.20'),
+        price_change('2025-01-12', '1.20', '0.90'),
+        price_change('2025-01-26', '0.90', '1.10'),
+        price_change('2025-02-03', '1.10', '1.50'),
+        price_change('2025-12-01', '1.50', '1.40'),
+    ])
+
+    stats = processor.compact_card_changes()
+
+    assert stats == {'dropped': 0, 'folded': 4, 'summaries': 2}
+    january, february, recent = processor.card_changes['crd_1']['changes']
+    assert {key: january[key] for key in ['field', 'period', 'first_date', 'last_date', 'date', 'count']} == {
+        'field': 'prices_summary', 'period': '2025-01', 'first_date': '2025-01-05', 'last_date': '2025-01-26',
+        'date': '2025-01-26', 'count': 3
+    }
+    assert january['old_value'] == {'usd': '1.00'}
+    assert january['new_value'] == {'usd': '1.10'}
+    assert january['min'] == {'usd': 0.90}
+    assert january['max'] == {'usd': 1.20}
+    assert (february['period'], february['count'], february['min'], february['max']) == (
+        '2025-02', 1, {'usd': 1.10}, {'usd': 1.50})
+    assert recent == price_change('2025-12-01', '1.50', '1.40')
+
+
+def test_other_fields_are_kept_verbatim(tmp_path):
+    kept = [
+        change('2025-01-05', 'text', 'Shift 5', 'Shift 4'),
+        change('2025-01-12', 'legalities', {'core': 'legal'}, {'core': 'banned'}),
+        change('2025-02-03', 'cost', 3, 4),
+    ]
+    processor = make_processor(tmp_path, copy.deepcopy(kept) + [price_change('2025-12-01', '1.50', '1.40')])
+
+    processor.compact_card_changes()
+
+    remaining = processor.card_changes['crd_1']['changes']
+    assert [json.dumps(c) for c in remaining[:3]] == [json.dumps(c) for c in kept]
+
+
+def test_same_date_flip_flops_are_dropped(tmp_path):
+    processor = make_processor(tmp_path, [
+        price_change('2025-11-03', '1.00', '1.20'),
+        price_change('2025-11-03', '1.20', '1.00'),
+        price_change('2025-11-10', '1.00', '1.00'),
+        price_change('2025-11-17', '1.00', '1.30'),
+        price_change('2025-11-24', '1.30', '1.00'),
+    ])
+
+    stats = processor.compact_card_changes()
+
+    assert stats['dropped'] == 3
+    # A revert on a later date is a real move and stays
+    assert processor.card_changes['crd_1']['changes'] == [
+        price_change('2025-11-17', '1.00', '1.30'),
+        price_change('2025-11-24', '1.30', '1.00'),
+    ]
+
+
+def test_second_pass_is_a_no_op(tmp_path):
+    processor = make_processor(tmp_path, [
+        price_change('2025-01-05', '1.00', '1.20'),
+        price_change('2025-01-05', '1.20', '1.00'),
+        price_change('2025-01-12', '1.00', '0.90'),
+        price_change('2025-02-03', '0.90', '1.50'),
+        change('2025-02-03', 'text', 'Shift 5', 'Shift 4'),
+        price_change('2025-12-01', '1.50', '1.40'),
+    ])
+    processor.compact_card_changes()
+    compacted = copy.deepcopy(processor.card_changes)
+
+    stats = processor.compact_card_changes()
+
+    assert stats == {'dropped': 0, 'folded': 0, 'summaries': 0}
+    assert processor.card_changes == compacted
+
+
+def write_snapshot(raw_dir, date, cards):
+    sets_dir = raw_dir / date / 'sets'
+    sets_dir.mkdir(parents=True)
+    (raw_dir / date / 'sets.json').write_text(json.dumps([{'id': 'set_t', 'name': 'Test Set', 'code': 'T'}]))
+    (sets_dir / 'set_t.json').write_text(json.dumps(cards))
+
+
+def test_rollup_totals_do_not_depend_on_retention(tmp_path):
+    raw_dir = tmp_path / 'raw'
+    snapshots = [
+        ('2025-01-05', '1.00', '2.00', 'Shift 5'), ('2025-01-19', '1.20', '2.40', 'Shift 5'),
+        ('2025-02-02', '0.90', '2.10', 'Shift 4'), ('2025-03-02', '1.10', '2.10', 'Shift 4'),
+        ('2025-09-01', '1.50', '1.80', 'Shift 4'), ('2025-10-01', '1.40', '1.90', 'Shift 4'),
+    ]
+    for date, elsa_usd, ariel_usd, text in snapshots:
+        write_snapshot(raw_dir, date, [
+            {'id': 'crd_1', 'name': 'Elsa', 'version': 'Snow Queen', 'text': text, 'prices': {'usd': elsa_usd}},
+            {'id': 'crd_2', 'name': 'Ariel', 'version': 'On Human Legs', 'prices': {'usd': ariel_usd}},
+        ])
+
+    rollups = {}
+    price_entries = {}
+    for retention_days in [0, 180]:
+        output_dir = tmp_path / f"retention_{retention_days}"
+        LorcanaDataProcessor(raw_dir, output_dir, retention_days=retention_days).run()
+        with open(output_dir / 'change_rollups.json', encoding='utf-8') as f:
+            rollups[retention_days] = json.load(f)
+        with open(output_dir / 'card_changes.json', encoding='utf-8') as f:
+            fields = [c['field'] for data in json.load(f).values() for c in data['changes']]
+        assert ('prices_summary' in fields) == bool(retention_days)
+        price_entries[retention_days] = fields.count('prices')
+
+    for key in ['total_changes', 'by_field', 'card_counts', 'top_cards']:
+        assert rollups[0][key] == rollups[180][key], key
+    # Every verbatim price change is still counted once it is folded
+    assert rollups[180]['by_field']['prices'] == price_entries[0] > price_entries[180]
@@ -0,0 +1,79 @@
+import json
+
+import pytest
+
+from lorcana_data_processor import LorcanaDataProcessor
+
+np = pytest.importorskip('numpy')
+
+FIRST_CHAPTER = 'set_7ecb0e0c71af496a9e0110e23824e0a5'
+
+
+def write_snapshot(raw_dir, date, cards):
+    """Write a raw snapshot with a First Chapter card file, named as older extractions did"""
+    sets_dir = raw_dir / date / 'sets'
+    sets_dir.mkdir(parents=True)
+    (raw_dir / date / 'sets.json').write_text(json.dumps([{'id': FIRST_CHAPTER, 'name': 'The First Chapter', 'code': '1'}]))
+    (sets_dir / 'the_first_chapter.json').write_text(json.dumps(cards))
+
+
+def card(card_id, legalities=None):
+    return {
+        'id': card_id, 'name': 'Elsa', 'version': 'Snow Queen', 'cost': 3, 'inks': ['Amethyst'],
+        'legalities': legalities or {}, 'prices': {'usd': '0.52'},
+        'set': {'id': FIRST_CHAPTER, 'code': '1', 'name': 'The First Chapter'}
+    }
+
+
+def read_partitions(root):
+    """Read every exported .npz file below root: path relative to root -> column arrays"""
+    partitions = {}
+    for npz_file in sorted(root.rglob('*.npz')):
+        with np.load(npz_file) as data:
+            partitions[npz_file.relative_to(root).as_posix()] = {name: data[name] for name in data.files}
+    return partitions
+
+
+def test_npz_export_shares_one_schema(tmp_path):
+    raw_dir = tmp_path / 'raw'
+    processed_dir = tmp_path / 'processed'
+    write_snapshot(raw_dir, '2025-05-11', [card('crd_1')])
+    write_snapshot(raw_dir, '2025-05-14', [card('crd_1', {'core': 'legal'}), card('crd_2')])
+    processor = LorcanaDataProcessor(raw_dir, processed_dir)
+    processor.run()
+    processor.export_columnar('npz')
+
+    export_dir = processed_dir / 'columnar' / 'npz'
+    history = read_partitions(export_dir / 'history')
+    # Partitioned by the cards' own set ID, not the mistyped friendly-name mapping
+    assert sorted(history) == [
+        f"snapshot_date=2025-05-11/set_id={FIRST_CHAPTER}/the_first_chapter.npz",
+        f"snapshot_date=2025-05-14/set_id={FIRST_CHAPTER}/the_first_chapter.npz",
+    ]
+    catalog = read_partitions(export_dir / 'catalog')
+    assert len(catalog) == 1 and list(catalog)[0].startswith(f"set_id={FIRST_CHAPTER}/")
+
+    schemas = {tuple(sorted(columns)) for columns in history.values()}
+    assert len(schemas) == 1
+    assert 'legality_core' in schemas.pop()
+    assert all('set_id' not in columns for columns in list(history.values()) + list(catalog.values()))
+
+    old, new = history.values()
+    assert list(old['legality_core']) == ['']
+    assert list(new['id']) == ['crd_1', 'crd_2']
+    assert list(new['legality_core']) == ['legal', '']
+    assert list(new['price_usd']) == [0.52, 0.52]
+    assert list(new['ink_amethyst']) == [True, True]
+
+    # A later snapshot with a new format rewrites every partition with its column
+    write_snapshot(raw_dir, '2025-05-21', [card('crd_1', {'core': 'legal', 'infinity': 'legal'})])
+    processor.export_columnar('npz')
+
+    history = read_partitions(export_dir / 'history')
+    assert len(history) == 3
+    schemas = {frozenset(columns) for columns in history.values()}
+    assert len(schemas) == 1
+    history_columns = schemas.pop()
+    assert 'legality_infinity' in history_columns
+    for columns in read_partitions(export_dir / 'catalog').values():
+        assert set(columns) == history_columns | {'created_at', 'updated_at'}
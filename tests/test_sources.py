@@ -0,0 +1,80 @@
+import json
+
+from lorcana_sources import FileSource, run_sources
+
+
+def card(card_id, name, version, number, cost, text=''):
+    return {
+        'id': card_id, 'name': name, 'version': version, 'collector_number': number,
+        'cost': cost, 'text': text, 'set': {'id': 'set_t', 'code': 'T', 'name': 'Test Set'}
+    }
+
+
+def write_source(source_dir, cards):
+    """Write a snapshot in the common raw layout"""
+    (source_dir / 'sets').mkdir(parents=True)
+    (source_dir / 'sets.json').write_text(json.dumps([{'id': 'set_t', 'code': 'T', 'name': 'Test Set'}]))
+    (source_dir / 'sets' / 'set_t.json').write_text(json.dumps(cards))
+
+
+def load_index(data_root):
+    with open(data_root / 'processed' / 'card_identity_index.json', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def test_run_sources_reconciles_shared_cards(tmp_path):
+    data_root = tmp_path / 'data'
+    # Providers use their own IDs; the Enchanted reprint shares name, version and set with #1
+    write_source(tmp_path / 'a', [
+        card('a1', 'Elsa', 'Snow Queen', '1', 3),
+        card('a2', 'Elsa', 'Snow Queen', '201', 3),
+        card('a3', 'Ariel', 'On Human Legs', '2', 4),
+        card('a4', 'Goofy', 'Musketeer', '3', 5),
+    ])
+    write_source(tmp_path / 'b', [
+        card('b1', 'Elsa', 'Snow Queen', '1', 3),
+        card('b2', 'Elsa', 'Snow Queen', '201', 3),
+        card('b3', 'Ariel', 'On Human Legs', '2', 5),
+    ])
+    sources = [FileSource('a', tmp_path / 'a', data_root), FileSource('b', tmp_path / 'b', data_root)]
+
+    assert run_sources(sources, workers=2, data_root=data_root) == []
+
+    index = load_index(data_root)
+    shared = [key for key, entries in index['cards'].items() if len(entries) > 1]
+    assert len(shared) == 3
+    assert sorted(index['conflicts']) == ['ariel|on human legs|t|2']
+    assert index['conflicts']['ariel|on human legs|t|2'] == {'cost': {'a': 4, 'b': 5}}
+
+    # Source a changes Ariel again and runs alone; the conflict with b must survive
+    write_source(tmp_path / 'a2', [
+        card('a1', 'Elsa', 'Snow Queen', '1', 3),
+        card('a2', 'Elsa', 'Snow Queen', '201', 3),
+        card('a3', 'Ariel', 'On Human Legs', '2', 4, 'Errata'),
+        card('a4', 'Goofy', 'Musketeer', '3', 5),
+        card('a5', 'Mickey Mouse', 'True Friend', '4', 3),
+    ])
+    assert run_sources([FileSource('a', tmp_path / 'a2', data_root)], workers=1, data_root=data_root) == []
+
+    index = load_index(data_root)
+    assert sorted(index['conflicts']) == ['ariel|on human legs|t|2']
+    assert sorted(index['conflicts']['ariel|on human legs|t|2']) == ['cost', 'text']
+    assert index['pending'] == []
+
+
+def test_unchanged_sources_are_not_reindexed(tmp_path, capsys):
+    data_root = tmp_path / 'data'
+    write_source(tmp_path / 'a', [card('a1', 'Elsa', 'Snow Queen', '1', 3)])
+    write_source(tmp_path / 'b', [card('b1', 'Elsa', 'Snow Queen', '1', 4)])
+    sources = [FileSource('a', tmp_path / 'a', data_root), FileSource('b', tmp_path / 'b', data_root)]
+    run_sources(sources, workers=2, data_root=data_root)
+    capsys.readouterr()
+
+    # Processing runs again and rewrites both card stores with the same cards
+    assert run_sources(sources, workers=2, data_root=data_root) == []
+
+    out = capsys.readouterr().out
+    assert '[a] Unchanged since last index update' in out
+    assert '[b] Unchanged since last index update' in out
+    assert 'Indexed' not in out
+    assert sorted(load_index(data_root)['conflicts']) == ['elsa|snow queen|t|1']